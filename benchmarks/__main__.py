@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+"""
+    Usage:
+        python -m benchmarks [--sizes 1,100,1000] [--mixes text,mixed]
+                             [--filter Envelope] [--output result.json]
+                             [--baseline baseline.json] [--threshold 0.1]
+
+    Prints the results as JSON; when a baseline is given, exits with
+    status 1 if any case is slower than the baseline by the threshold.
+"""
+
+import argparse
+import json
+import platform
+import sys
+
+from .plugins import load_plugins
+from .suite import run_suite, compare
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='benchmarks', description='DKD protocol benchmarks')
+    parser.add_argument('--sizes', default=None, help='batch sizes, e.g. "1,100,1000"')
+    parser.add_argument('--mixes', default=None, help='content mixes, e.g. "text,mixed,commands"')
+    parser.add_argument('--filter', default=None, help='only run cases contain this string')
+    parser.add_argument('--repeat', type=int, default=5, help='take the best of N runs')
+    parser.add_argument('--min-time', type=float, default=0.05, help='minimum seconds for each run')
+    parser.add_argument('--output', default=None, help='save results to this file')
+    parser.add_argument('--baseline', default=None, help='compare with results in this file')
+    parser.add_argument('--threshold', type=float, default=0.1, help='allowed slowdown ratio (0.1 = 10%%)')
+    args = parser.parse_args(argv)
+    sizes = None if args.sizes is None else [int(x) for x in args.sizes.split(',')]
+    mixes = None if args.mixes is None else args.mixes.split(',')
+    load_plugins()
+    results = run_suite(sizes=sizes, mixes=mixes, repeat=args.repeat, min_time=args.min_time, pattern=args.filter)
+    output = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'results': results,
+    }
+    if args.output is not None:
+        with open(args.output, 'w') as fp:
+            json.dump(output, fp, indent=2, sort_keys=True)
+    regressions = 0
+    if args.baseline is not None:
+        with open(args.baseline, 'r') as fp:
+            baseline = json.load(fp)
+        report = compare(results=results, baseline=baseline.get('results', {}), threshold=args.threshold)
+        regressions = sum(1 for item in report.values() if item['regression'])
+        output['comparison'] = report
+        output['regressions'] = regressions
+    json.dump(output, sys.stdout, indent=2, sort_keys=True)
+    sys.stdout.write('\n')
+    return 1 if regressions > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,434 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+"""
+    Reference Plugins
+    ~~~~~~~~~~~~~~~~~
+
+    In-memory coders, helpers and factories for benchmarking the
+    protocol layer without any crypto or storage.
+"""
+
+import base64
+import json
+from typing import Optional, Any, Dict
+
+from mkm.types import ConstantString
+from mkm.types import DateTime
+from mkm.types import StrMap
+from mkm.format import DataCoder, ObjectCoder, StringCoder
+from mkm.format import Base64, JSON, UTF8
+from mkm.format import TransportableData, TransportableDataFactory
+from mkm.protocol import EntityType
+from mkm.protocol import Address, ID, Identifier
+from mkm import TransportableDataHelper, shared_format_extensions
+from mkm import IDHelper, shared_account_extensions
+
+from dkd import Content, Envelope
+from dkd import InstantMessage, SecureMessage, ReliableMessage
+from dkd import InstantMessageFactory, SecureMessageFactory
+from dkd import EnvelopeHelper, InstantMessageHelper, SecureMessageHelper, ReliableMessageHelper
+from dkd import ContentFactory, ContentGeneralFactory
+from dkd import shared_message_extensions
+from dkd import BaseContent, BaseMessage
+from dkd import MessageEnvelopeFactory
+from dkd import EncryptedMessage, NetworkMessageFactory
+from dkd import SerialNumberGenerator
+
+
+#
+#   Coders
+#
+
+class Base64Coder(DataCoder):
+
+    # Override
+    def encode(self, data: bytes) -> str:
+        return base64.b64encode(data).decode('ascii')
+
+    # Override
+    def decode(self, string: str) -> Optional[bytes]:
+        return base64.b64decode(string)
+
+
+class JSONCoder(ObjectCoder):
+
+    # Override
+    def encode(self, container: Any) -> str:
+        return json.dumps(container, separators=(',', ':'))
+
+    # Override
+    def decode(self, string: str) -> Optional[Any]:
+        return json.loads(string)
+
+
+class UTF8Coder(StringCoder):
+
+    # Override
+    def encode(self, string: str) -> bytes:
+        return string.encode('utf-8')
+
+    # Override
+    def decode(self, data: bytes) -> Optional[str]:
+        return bytes(data).decode('utf-8')
+
+
+#
+#   Format
+#
+
+class Base64Data(ConstantString, TransportableData):
+    """ Base64 string, decoded on demand """
+
+    def __init__(self, string: Optional[str] = None, data: Optional[bytes] = None):
+        if string is None:
+            string = Base64.encode(data)
+        super().__init__(string=string)
+        self.__data = data
+
+    @property  # Override
+    def encoding(self) -> Optional[str]:
+        return 'base64'
+
+    # Override
+    def to_bytes(self) -> Optional[bytes]:
+        data = self.__data
+        if data is None:
+            data = Base64.decode(str(self))
+            self.__data = data
+        return data
+
+    # Override
+    def __len__(self) -> int:
+        return len(self.to_bytes())
+
+    @property  # Override
+    def is_empty(self) -> bool:
+        return len(self) == 0
+
+    # Override
+    def serialize(self) -> str:
+        return str(self)
+
+
+class TEDHelper(TransportableDataHelper):
+
+    def __init__(self):
+        super().__init__()
+        self.__factory = None
+
+    # Override
+    def set_transportable_data_factory(self, factory: TransportableDataFactory):
+        self.__factory = factory
+
+    # Override
+    def get_transportable_data_factory(self) -> Optional[TransportableDataFactory]:
+        return self.__factory
+
+    # Override
+    def parse_transportable_data(self, ted: Any) -> Optional[TransportableData]:
+        if ted is None:
+            return None
+        elif isinstance(ted, TransportableData):
+            return ted
+        return Base64Data(string=str(ted))
+
+    # Override
+    def create_transportable_data(self, data: bytes, encoding: Optional[str] = None,
+                                  mime_type: Optional[str] = None,
+                                  parameters: Optional[StrMap] = None) -> TransportableData:
+        return Base64Data(data=data)
+
+
+#
+#   Account
+#
+
+class SimpleAddress(ConstantString, Address):
+
+    def __init__(self, address: str, network: int):
+        super().__init__(string=address)
+        self.__network = network
+
+    @property  # Override
+    def network(self) -> int:
+        return self.__network
+
+
+class SimpleIDHelper(IDHelper):
+    """ Parse 'name@address/terminal', addresses start with 'g' are groups """
+
+    def __init__(self):
+        super().__init__()
+        self.__ids: Dict[str, ID] = {}
+
+    # Override
+    def set_id_factory(self, factory):
+        pass
+
+    # Override
+    def get_id_factory(self):
+        return None
+
+    # Override
+    def create_id(self, name: Optional[str], address: Address, terminal: Optional[str]) -> ID:
+        return Identifier.new(name=name, address=address, terminal=terminal)
+
+    # Override
+    def parse_id(self, identifier: Any) -> Optional[ID]:
+        if identifier is None:
+            return None
+        elif isinstance(identifier, ID):
+            return identifier
+        identifier = str(identifier)
+        did = self.__ids.get(identifier)
+        if did is None:
+            head, _, terminal = identifier.partition('/')
+            name, _, address = head.rpartition('@')
+            network = EntityType.GROUP if address.startswith('g') else EntityType.USER
+            address = SimpleAddress(address=address, network=network.value)
+            did = Identifier(identifier=identifier, name=name or None, address=address, terminal=terminal or None)
+            self.__ids[identifier] = did
+        return did
+
+
+#
+#   Content
+#
+
+class SimpleContent(BaseContent):
+    """ Content for all types """
+
+
+class SimpleContentFactory(ContentFactory):
+
+    # Override
+    def parse_content(self, content: StrMap) -> Optional[Content]:
+        return SimpleContent(content=content)
+
+
+#
+#   Messages
+#
+
+class PlainMessage(BaseMessage, InstantMessage):
+
+    def __init__(self, msg: Optional[StrMap] = None, head: Optional[Envelope] = None, body: Optional[Content] = None):
+        if msg is None:
+            msg = head.copy_map(False)
+            msg['content'] = body.to_map()
+        super().__init__(msg=msg, head=head)
+        self.__content = body
+
+    @property  # Override
+    def content(self) -> Content:
+        body = self.__content
+        if body is None:
+            body = Content.parse(content=self.get('content'))
+            self.__content = body
+        return body
+
+    @property  # Override
+    def time(self) -> Optional[DateTime]:
+        when = self.content.time
+        if when is None:
+            when = self.envelope.time
+        return when
+
+    @property  # Override
+    def group(self) -> Optional[ID]:
+        return self.content.group
+
+    @property  # Override
+    def type(self) -> Optional[str]:
+        return self.content.type
+
+
+class MessageFactory(InstantMessageFactory, SecureMessageFactory):
+
+    def __init__(self):
+        super().__init__()
+        self.__sn = SerialNumberGenerator()
+
+    # Override
+    def generate_serial_number(self, msg_type: Optional[str], now: Optional[DateTime]) -> int:
+        return self.__sn.next()
+
+    # Override
+    def create_instant_message(self, head: Envelope, body: Content) -> InstantMessage:
+        return PlainMessage(head=head, body=body)
+
+    # Override
+    def parse_instant_message(self, msg: StrMap) -> Optional[InstantMessage]:
+        if 'sender' not in msg or 'content' not in msg:
+            return None
+        return PlainMessage(msg=msg)
+
+    # Override
+    def parse_secure_message(self, msg: StrMap) -> Optional[SecureMessage]:
+        if 'sender' not in msg or 'data' not in msg:
+            return None
+        if 'signature' in msg:
+            return ReliableMessage.parse(msg=msg)
+        return EncryptedMessage(msg=msg)
+
+
+class MessageHelper(EnvelopeHelper, InstantMessageHelper, SecureMessageHelper, ReliableMessageHelper):
+    """ General helper for envelope & messages """
+
+    def __init__(self):
+        super().__init__()
+        self.__envelope_factory = None
+        self.__instant_factory = None
+        self.__secure_factory = None
+        self.__reliable_factory = None
+
+    #
+    #   Envelope
+    #
+
+    # Override
+    def set_envelope_factory(self, factory):
+        self.__envelope_factory = factory
+
+    # Override
+    def get_envelope_factory(self):
+        return self.__envelope_factory
+
+    # Override
+    def create_envelope(self, sender: ID, receiver: ID, time: Optional[DateTime]) -> Envelope:
+        return self.__envelope_factory.create_envelope(sender=sender, receiver=receiver, time=time)
+
+    # Override
+    def parse_envelope(self, envelope: Any) -> Optional[Envelope]:
+        if envelope is None:
+            return None
+        elif isinstance(envelope, Envelope):
+            return envelope
+        return self.__envelope_factory.parse_envelope(envelope=envelope)
+
+    #
+    #   Instant Message
+    #
+
+    # Override
+    def set_instant_message_factory(self, factory):
+        self.__instant_factory = factory
+
+    # Override
+    def get_instant_message_factory(self):
+        return self.__instant_factory
+
+    # Override
+    def generate_serial_number(self, msg_type: Optional[str], now: Optional[DateTime]) -> int:
+        return self.__instant_factory.generate_serial_number(msg_type, now)
+
+    # Override
+    def create_instant_message(self, head: Envelope, body: Content) -> InstantMessage:
+        return self.__instant_factory.create_instant_message(head, body)
+
+    # Override
+    def parse_instant_message(self, msg: Any) -> Optional[InstantMessage]:
+        if msg is None:
+            return None
+        elif isinstance(msg, InstantMessage):
+            return msg
+        return self.__instant_factory.parse_instant_message(msg=msg)
+
+    #
+    #   Secure Message
+    #
+
+    # Override
+    def set_secure_message_factory(self, factory):
+        self.__secure_factory = factory
+
+    # Override
+    def get_secure_message_factory(self):
+        return self.__secure_factory
+
+    # Override
+    def parse_secure_message(self, msg: Any) -> Optional[SecureMessage]:
+        if msg is None:
+            return None
+        elif isinstance(msg, SecureMessage):
+            return msg
+        return self.__secure_factory.parse_secure_message(msg=msg)
+
+    #
+    #   Reliable Message
+    #
+
+    # Override
+    def set_reliable_message_factory(self, factory):
+        self.__reliable_factory = factory
+
+    # Override
+    def get_reliable_message_factory(self):
+        return self.__reliable_factory
+
+    # Override
+    def parse_reliable_message(self, msg: Any) -> Optional[ReliableMessage]:
+        if msg is None:
+            return None
+        elif isinstance(msg, ReliableMessage):
+            return msg
+        return self.__reliable_factory.parse_reliable_message(msg=msg)
+
+
+# content types for benchmarking
+CONTENT_TYPES = ['1', '16', '18', '20', '32', '136']
+
+
+def load_plugins():
+    """ Register all reference coders, helpers and factories """
+    Base64.coder = Base64Coder()
+    JSON.coder = JSONCoder()
+    UTF8.coder = UTF8Coder()
+    shared_format_extensions.ted_helper = TEDHelper()
+    shared_account_extensions.id_helper = SimpleIDHelper()
+    # message helpers
+    helper = MessageHelper()
+    ext = shared_message_extensions
+    ext.content_helper = ContentGeneralFactory()
+    ext.envelope_helper = helper
+    ext.instant_helper = helper
+    ext.secure_helper = helper
+    ext.reliable_helper = helper
+    # message factories
+    content_factory = SimpleContentFactory()
+    for msg_type in CONTENT_TYPES:
+        Content.set_factory(msg_type, factory=content_factory)
+    Content.set_factory('*', factory=content_factory)
+    factory = MessageFactory()
+    Envelope.set_factory(factory=MessageEnvelopeFactory())
+    InstantMessage.set_factory(factory=factory)
+    SecureMessage.set_factory(factory=factory)
+    ReliableMessage.set_factory(factory=NetworkMessageFactory())
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+"""
+    Benchmark Suite
+    ~~~~~~~~~~~~~~~
+
+    Time every factory path in dkd.protocol at various batch sizes
+    and content mixes.
+"""
+
+import random
+import time
+from typing import Optional, Callable, List, Dict
+
+from mkm.protocol import ID
+
+from dkd import Content, Envelope
+from dkd import InstantMessage, SecureMessage, ReliableMessage
+
+from .plugins import CONTENT_TYPES
+
+
+BATCH_SIZES = [1, 100, 1000]
+
+# content type => weight
+CONTENT_MIXES = {
+    'text': {'1': 1},
+    'mixed': {msg_type: 1 for msg_type in CONTENT_TYPES},
+    'commands': {'1': 1, '136': 4},
+}
+
+
+class Case:
+    """ Benchmark case, 'prepare' returns the function to be timed """
+
+    def __init__(self, name: str, prepare: Callable[[int, str], Callable[[], None]], mixed: bool = False):
+        super().__init__()
+        self.name = name
+        self.prepare = prepare
+        self.mixed = mixed
+
+
+#
+#   Samples
+#
+
+def _ids(count: int, prefix: str) -> List[str]:
+    return ['%s%d@address%d' % (prefix, i, i) for i in range(count)]
+
+
+def sample_envelopes(size: int) -> List[Dict]:
+    senders = _ids(count=16, prefix='user')
+    receivers = _ids(count=16, prefix='friend')
+    return [{
+        'sender': senders[i % 16],
+        'receiver': receivers[(i * 7) % 16],
+        'time': 1545405083 + i,
+    } for i in range(size)]
+
+
+def sample_contents(size: int, mix: str) -> List[Dict]:
+    weights = CONTENT_MIXES[mix]
+    types = random.Random(size).choices(list(weights.keys()), weights=list(weights.values()), k=size)
+    return [{
+        'type': msg_type,
+        'sn': 412968873 + i,
+        'time': 1545405083 + i,
+        'text': 'Hey guy!',
+    } for i, msg_type in enumerate(types)]
+
+
+def sample_instant_messages(size: int, mix: str) -> List[Dict]:
+    contents = sample_contents(size=size, mix=mix)
+    messages = sample_envelopes(size=size)
+    for info, content in zip(messages, contents):
+        info['content'] = content
+    return messages
+
+
+def sample_secure_messages(size: int) -> List[Dict]:
+    messages = sample_envelopes(size=size)
+    for info in messages:
+        info['data'] = '9cjCKG99ULCCxbL2mkc/MgF1saeRqJaCc+S12+HCqmsuF7TWK61EwTQWZSKskUeF'
+        info['keys'] = {
+            info['receiver']: 'WH/wAcu+HfpaLq+vRblNnYufkyjTm4FgYyzW3wBDeRtXs1TeDmRxKVu7nQI=',
+            'digest': 'm4FgYyzW3wBDeRtX',
+        }
+    return messages
+
+
+def sample_reliable_messages(size: int) -> List[Dict]:
+    messages = sample_secure_messages(size=size)
+    for info in messages:
+        info['signature'] = 'Yo+hchWsQlWHtc8iMGS7jpn/i9pOLNq0E3dTNsx80QdBboTLeKoJYAg/lI+kZL+g7oWJYpD4qKemOwzI='
+    return messages
+
+
+#
+#   Cases
+#
+
+def _envelope_create(size: int, mix: str):
+    pairs = [(ID.parse(info['sender']), ID.parse(info['receiver'])) for info in sample_envelopes(size=size)]
+
+    def run():
+        for sender, receiver in pairs:
+            Envelope.create(sender=sender, receiver=receiver)
+    return run
+
+
+def _envelope_parse(size: int, mix: str):
+    array = sample_envelopes(size=size)
+
+    def run():
+        for info in array:
+            Envelope.parse(envelope=info).sender
+    return run
+
+
+def _content_parse(size: int, mix: str):
+    array = sample_contents(size=size, mix=mix)
+
+    def run():
+        for info in array:
+            Content.parse(content=info)
+    return run
+
+
+def _instant_create(size: int, mix: str):
+    pairs = [(Envelope.parse(envelope=info), Content.parse(content=info['content']))
+             for info in sample_instant_messages(size=size, mix=mix)]
+
+    def run():
+        for head, body in pairs:
+            InstantMessage.create(head=head, body=body)
+    return run
+
+
+def _instant_parse(size: int, mix: str):
+    array = sample_instant_messages(size=size, mix=mix)
+
+    def run():
+        for info in array:
+            InstantMessage.parse(msg=info).content
+    return run
+
+
+def _instant_generate_serial_number(size: int, mix: str):
+    types = [info['type'] for info in sample_contents(size=size, mix=mix)]
+
+    def run():
+        for msg_type in types:
+            InstantMessage.generate_serial_number(msg_type=msg_type)
+    return run
+
+
+def _secure_parse(size: int, mix: str):
+    array = sample_secure_messages(size=size)
+
+    def run():
+        for info in array:
+            SecureMessage.parse(msg=info)
+    return run
+
+
+def _reliable_parse(size: int, mix: str):
+    array = sample_reliable_messages(size=size)
+
+    def run():
+        for info in array:
+            ReliableMessage.parse(msg=info)
+    return run
+
+
+def _reliable_convert(size: int, mix: str):
+    array = sample_reliable_messages(size=size)
+
+    def run():
+        ReliableMessage.convert(array)
+    return run
+
+
+def _reliable_revert(size: int, mix: str):
+    messages = ReliableMessage.convert(sample_reliable_messages(size=size))
+
+    def run():
+        ReliableMessage.revert(messages)
+    return run
+
+
+CASES = [
+    Case(name='Envelope.create', prepare=_envelope_create),
+    Case(name='Envelope.parse', prepare=_envelope_parse),
+    Case(name='Content.parse', prepare=_content_parse, mixed=True),
+    Case(name='InstantMessage.create', prepare=_instant_create, mixed=True),
+    Case(name='InstantMessage.parse', prepare=_instant_parse, mixed=True),
+    Case(name='InstantMessage.generate_serial_number', prepare=_instant_generate_serial_number),
+    Case(name='SecureMessage.parse', prepare=_secure_parse),
+    Case(name='ReliableMessage.parse', prepare=_reliable_parse),
+    Case(name='ReliableMessage.convert', prepare=_reliable_convert),
+    Case(name='ReliableMessage.revert', prepare=_reliable_revert),
+]
+
+
+#
+#   Runner
+#
+
+def measure(run: Callable[[], None], size: int, repeat: int, min_time: float) -> float:
+    """ Return the best time (nanoseconds) per item """
+    # calibrate loops to run at least 'min_time' seconds per repeat
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e9 / (loops * size)
+
+
+def run_suite(sizes: Optional[List[int]] = None, mixes: Optional[List[str]] = None,
+              repeat: int = 5, min_time: float = 0.05, pattern: Optional[str] = None) -> Dict[str, Dict]:
+    """
+    Run benchmark cases
+
+    :param sizes:    batch sizes
+    :param mixes:    content mixes (for content/instant message cases)
+    :param repeat:   take the best of N
+    :param min_time: minimum seconds for each repeat
+    :param pattern:  only run cases contain this string
+    :return: {"case[size=N,mix=M]": {"ns_per_item": ..., "items_per_sec": ...}}
+    """
+    if sizes is None:
+        sizes = BATCH_SIZES
+    if mixes is None:
+        mixes = list(CONTENT_MIXES.keys())
+    results = {}
+    for case in CASES:
+        if pattern is not None and pattern not in case.name:
+            continue
+        for size in sizes:
+            for mix in (mixes if case.mixed else ['text']):
+                if case.mixed:
+                    key = '%s[size=%d,mix=%s]' % (case.name, size, mix)
+                else:
+                    key = '%s[size=%d]' % (case.name, size)
+                run = case.prepare(size, mix)
+                ns = measure(run=run, size=size, repeat=repeat, min_time=min_time)
+                results[key] = {
+                    'ns_per_item': round(ns, 2),
+                    'items_per_sec': round(1e9 / ns, 1),
+                }
+    return results
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> Dict[str, Dict]:
+    """ Compare results with the baseline, the ratio > 1 means slower """
+    report = {}
+    for key, item in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        ratio = item['ns_per_item'] / base['ns_per_item']
+        report[key] = {
+            'baseline': base['ns_per_item'],
+            'current': item['ns_per_item'],
+            'ratio': round(ratio, 3),
+            'regression': ratio > 1 + threshold,
+        }
+    return report
@@ -30,6 +30,10 @@
 
 from .protocol import *
 from .ext import *
+from .msg import *
+from .format import *
+from .utils import *
+from .crypto import *
 
 
 name = "DaoKeDao"
@@ -46,6 +50,8 @@ __all__ = [
     'Message',
     'InstantMessage', 'SecureMessage', 'ReliableMessage',
 
+    'EncryptedKeys',
+
     'ContentFactory', 'EnvelopeFactory',
     'InstantMessageFactory', 'SecureMessageFactory', 'ReliableMessageFactory',
 
@@ -63,10 +69,59 @@ __all__ = [
     'ContentHelper', 'EnvelopeHelper',
     'InstantMessageHelper', 'SecureMessageHelper', 'ReliableMessageHelper',
 
+    'AsyncContentHelper', 'AsyncEnvelopeHelper',
+    'AsyncInstantMessageHelper', 'AsyncSecureMessageHelper', 'AsyncReliableMessageHelper',
+
     'ContentExtension',
     'InstantMessageExtension', 'SecureMessageExtension', 'ReliableMessageExtension',
     'MessageExtensions', 'shared_message_extensions',
 
     'GeneralMessageHelper', 'GeneralMessageExtension',
 
+    'ContentGeneralFactory',
+    'ParseCache', 'CachedContentHelper', 'CachedEnvelopeHelper',
+    'AsyncMessageHelper',
+    'HelperMetrics',
+
+    #
+    #   Messages
+    #
+
+    # 'Dictionary',
+
+    'MessageEnvelope', 'MessageEnvelopeFactory',
+    'BaseContent',
+
+    'BaseMessage',
+    'EncryptedMessage',
+    'NetworkMessage', 'NetworkMessageFactory',
+
+    'SerialNumberGenerator',
+
+    #
+    #   Format
+    #
+
+    'ReliableMessageCoder', 'BinaryNetworkMessage',
+    'IDTable', 'EnvelopeCoder',
+    'MessageStreamDecoder',
+
+    #
+    #   Utils
+    #
+
+    'EnvelopeFilter',
+    'MessageLog',
+    'MessageDeduplicator',
+    'MessageScheduler',
+    'merge_messages', 'time_windows',
+
+    #
+    #   Crypto
+    #
+
+    'BatchVerifier',
+    'BatchEncrypter',
+    'CipherKeyCache',
+
 ]
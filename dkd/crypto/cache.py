@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Any, Callable, Dict, Tuple
+
+from mkm.protocol import ID
+
+from ..protocol import SecureMessage
+
+
+# (key, digest, expires)
+_Entry = Tuple[Any, Optional[str], float]
+
+
+class CipherKeyCache:
+    """ Symmetric key cache for messages
+
+        Keys are cached for the direction (sender, receiver or group)
+        with the 'digest' of the key, and expired by TTL & LRU.
+
+        Encrypt side:
+            reuse the key from 'get_key(me, receiver)', and omit the
+            'keys' (or keep 'digest' only) for the receiver.
+        Decrypt side:
+            'decrypt_key(msg, me, decrypt)' returns the cached key only
+            when the message has no keys, or its digest matches, so the
+            asymmetric decryption is skipped; otherwise the key carried
+            by the message is decrypted.
+    """
+
+    def __init__(self, ttl: float = 3600, maxsize: int = 4096,
+                 clock: Callable[[], float] = time.monotonic):
+        super().__init__()
+        self.__ttl = ttl
+        self.__maxsize = maxsize
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__entries: OrderedDict = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self.__hits,
+            'misses': self.__misses,
+            'size': len(self.__entries),
+        }
+
+    def __get(self, sender: ID, receiver: ID) -> Optional[_Entry]:
+        direction = (str(sender), str(receiver))
+        with self.__lock:
+            entry = self.__entries.get(direction)
+            if entry is None:
+                return None
+            elif entry[2] < self.__clock():
+                # expired
+                del self.__entries[direction]
+                return None
+            self.__entries.move_to_end(direction)
+            return entry
+
+    def get_key(self, sender: ID, receiver: ID) -> Optional[Any]:
+        """ Get cipher key for direction (receiver may be group ID) """
+        entry = self.__get(sender, receiver)
+        if entry is not None:
+            return entry[0]
+
+    def get_digest(self, sender: ID, receiver: ID) -> Optional[str]:
+        """ Get digest of the cipher key for direction """
+        entry = self.__get(sender, receiver)
+        if entry is not None:
+            return entry[1]
+
+    def cache_key(self, sender: ID, receiver: ID, key: Any, digest: Optional[str] = None):
+        """ Cache cipher key for direction """
+        direction = (str(sender), str(receiver))
+        entry = (key, digest, self.__clock() + self.__ttl)
+        with self.__lock:
+            entries = self.__entries
+            entries[direction] = entry
+            entries.move_to_end(direction)
+            while len(entries) > self.__maxsize:
+                entries.popitem(last=False)
+
+    def remove_key(self, sender: ID, receiver: ID):
+        with self.__lock:
+            self.__entries.pop((str(sender), str(receiver)), None)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    #
+    #   Decrypt side
+    #
+
+    def get_message_key(self, msg: SecureMessage) -> Optional[Any]:
+        """
+        Get cached key if the message has no keys, or its digest matches;
+        when the message carries keys without digest, the key may be
+        rotated, so it's a miss and the carried key should be decrypted.
+        """
+        group = msg.group
+        receiver = msg.receiver if group is None else group
+        entry = self.__get(msg.sender, receiver)
+        if entry is None:
+            self.__misses += 1
+            return None
+        keys = msg.message_keys
+        if keys is not None:
+            digest = keys.digest
+            if digest is None or digest != entry[1]:
+                # key changed (or cannot be checked)
+                self.__misses += 1
+                return None
+        self.__hits += 1
+        return entry[0]
+
+    def decrypt_key(self, msg: SecureMessage, receiver: ID,
+                    decrypt: Callable[[Any], Optional[Any]]) -> Optional[Any]:
+        """
+        Get cipher key for the message, decrypt it only when not cached
+
+        :param msg:      secure message
+        :param receiver: actual receiver (me), for group message
+        :param decrypt:  function(encrypted_key) => cipher key
+        :return: cipher key
+        """
+        key = self.get_message_key(msg)
+        if key is not None:
+            return key
+        keys = msg.message_keys
+        if keys is None:
+            return None
+        encrypted = keys.get_key(receiver)
+        if encrypted is None:
+            return None
+        key = decrypt(encrypted)
+        if key is not None:
+            group = msg.group
+            self.cache_key(sender=msg.sender, receiver=msg.receiver if group is None else group,
+                           key=key, digest=keys.digest)
+        return key
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+from concurrent.futures import Executor
+from typing import Optional, Any, Callable, Iterable, Sequence, List, Dict, Tuple
+
+from mkm.format import JSONMap
+from mkm.format import TransportableData
+from mkm.protocol import ID
+
+from ..protocol import Content
+from ..protocol import InstantMessage, SecureMessage
+
+
+# (receiver, public key)
+_Item = Tuple[str, Any]
+
+
+def _encrypt_items(encrypt_key: Callable[[Any, bytes], bytes], key_data: bytes,
+                   items: Sequence[_Item]) -> List[Tuple[str, Optional[bytes]]]:
+    """ encrypt the password for receivers (runs in worker) """
+    results = []
+    for receiver, public_key in items:
+        try:
+            results.append((receiver, encrypt_key(public_key, key_data)))
+        except Exception:
+            results.append((receiver, None))
+    return results
+
+
+def serialize_content(content: Content) -> bytes:
+    """ default content serializer: JSON + UTF-8 """
+    return JSONMap.encode(content.to_map()).encode('utf-8')
+
+
+class BatchEncrypter:
+    """ Batch encrypter for group message
+
+        Algorithm:
+            data = password.encrypt(content)      // once
+            key  = member.public_key.encrypt(password)  // for each member
+
+        The content is serialized & encrypted once, and the password is
+        encrypted for members in chunks by the executor (a ProcessPoolExecutor
+        needs 'encrypt_key' and the public keys to be picklable).
+    """
+
+    def __init__(self, resolve_key: Callable[[ID], Optional[Any]],
+                 encrypt_data: Callable[[Any, bytes], bytes],
+                 encrypt_key: Callable[[Any, bytes], bytes],
+                 serialize: Callable[[Content], bytes] = serialize_content,
+                 executor: Optional[Executor] = None, chunk_size: int = 32):
+        """
+        Create batch encrypter
+
+        :param resolve_key:  function to get public key (for encryption) of the member
+        :param encrypt_data: function(password, plaintext) => ciphertext
+        :param encrypt_key:  function(public_key, key_data) => encrypted key
+        :param serialize:    function to serialize content
+        :param executor:     executor for key encryption, None to run in current thread
+        :param chunk_size:   max members in a task
+        """
+        super().__init__()
+        self.__resolve_key = resolve_key
+        self.__encrypt_data = encrypt_data
+        self.__encrypt_key = encrypt_key
+        self.__serialize = serialize
+        self.__executor = executor
+        self.__chunk_size = chunk_size
+
+    def encrypt_keys(self, key_data: bytes, members: Iterable[ID]) -> Tuple[Dict[str, bytes], List[ID]]:
+        """
+        Encrypt password for members
+
+        :param key_data: serialized password
+        :param members:  receivers
+        :return: (receiver => encrypted key, members failed: no key, resolving or encryption error)
+        """
+        items = []
+        failed = []
+        for member in members:
+            try:
+                public_key = self.__resolve_key(member)
+            except Exception:
+                # don't let one member abort the whole group
+                public_key = None
+            if public_key is None:
+                failed.append(member)
+            else:
+                items.append((str(member), public_key))
+        size = self.__chunk_size
+        chunks = [items[start:start + size] for start in range(0, len(items), size)]
+        encrypt_key = self.__encrypt_key
+        executor = self.__executor
+        if executor is None or len(chunks) < 2:
+            results = [_encrypt_items(encrypt_key, key_data, chunk) for chunk in chunks]
+        else:
+            futures = [executor.submit(_encrypt_items, encrypt_key, key_data, chunk) for chunk in chunks]
+            results = [future.result() for future in futures]
+        keys = {}
+        for chunk in results:
+            for receiver, encrypted in chunk:
+                if encrypted is None:
+                    failed.append(ID.parse(identifier=receiver))
+                else:
+                    keys[receiver] = encrypted
+        return keys, failed
+
+    def encrypt_message(self, msg: InstantMessage, password: Any, key_data: bytes,
+                        members: Iterable[ID],
+                        digest: Optional[str] = None) -> Tuple[Optional[SecureMessage], List[ID]]:
+        """
+        Encrypt group message for members
+
+        :param msg:      instant message
+        :param password: symmetric key
+        :param key_data: serialized password, for encrypting by public keys
+        :param members:  group members
+        :param digest:   hash of the password (optional)
+        :return: (secure message with keys for members, members failed);
+                 the failed members (no public key, or encryption error)
+                 are omitted from the keys, the caller should retry or
+                 report them
+        """
+        body = self.__serialize(msg.content)
+        data = self.__encrypt_data(password, body)
+        encrypted_keys, failed = self.encrypt_keys(key_data=key_data, members=members)
+        keys = {receiver: TransportableData.create(data=value).serialize()
+                for receiver, value in encrypted_keys.items()}
+        if digest is not None:
+            keys['digest'] = digest
+        info = msg.copy_map(False)
+        info.pop('content', None)
+        info['data'] = TransportableData.create(data=data).serialize()
+        info['keys'] = keys
+        return SecureMessage.parse(msg=info), failed
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+from concurrent.futures import Executor
+from typing import Optional, Any, Callable, Iterable, Sequence, List, Dict, Tuple
+
+from mkm.protocol import ID
+
+from ..protocol import ReliableMessage
+
+
+# (index, data, signature)
+_Item = Tuple[int, bytes, bytes]
+
+
+def _verify_items(verify: Callable[[Any, bytes, bytes], bool], key: Any,
+                  items: Sequence[_Item]) -> List[Tuple[int, bool]]:
+    """ verify signatures with one key (runs in worker) """
+    results = []
+    for index, data, signature in items:
+        try:
+            ok = bool(verify(key, data, signature))
+        except Exception:
+            ok = False
+        results.append((index, ok))
+    return results
+
+
+class BatchVerifier:
+    """ Batch signature verifier for reliable messages
+
+        Messages are grouped by sender, the key of each sender is resolved
+        once, then the signatures are verified in chunks by the executor
+        (a ProcessPoolExecutor runs them without the GIL; in that case,
+        the 'verify' function and the keys must be picklable).
+
+        Results are in the same order as the messages:
+            True  - signature matched
+            False - signature not matched (or data/signature missing)
+            None  - key not found for the sender (or failed to resolve it)
+    """
+
+    def __init__(self, resolve_key: Callable[[ID], Optional[Any]],
+                 verify: Callable[[Any, bytes, bytes], bool],
+                 executor: Optional[Executor] = None, chunk_size: int = 64):
+        """
+        Create batch verifier
+
+        :param resolve_key: function to get public key of the sender
+        :param verify:      function(key, data, signature) => bool
+        :param executor:    executor for verifying, None to run in current thread
+        :param chunk_size:  max signatures in a task
+        """
+        super().__init__()
+        self.__resolve_key = resolve_key
+        self.__verify = verify
+        self.__executor = executor
+        self.__chunk_size = chunk_size
+
+    def verify_messages(self, messages: Sequence[ReliableMessage]) -> List[Optional[bool]]:
+        results: List[Optional[bool]] = [False] * len(messages)
+        # group by sender
+        groups: Dict[ID, List[_Item]] = {}
+        for index, msg in enumerate(messages):
+            data = msg.data
+            signature = msg.signature
+            if data is None or signature is None:
+                continue
+            items = groups.get(msg.sender)
+            if items is None:
+                items = []
+                groups[msg.sender] = items
+            items.append((index, data.to_bytes(), signature.to_bytes()))
+        # resolve keys & split tasks
+        tasks = []
+        for sender, items in groups.items():
+            try:
+                key = self.__resolve_key(sender)
+            except Exception:
+                # don't let one sender abort the whole batch
+                key = None
+            if key is None:
+                for item in items:
+                    results[item[0]] = None
+                continue
+            size = self.__chunk_size
+            for start in range(0, len(items), size):
+                tasks.append((key, items[start:start + size]))
+        for index, ok in self.__run(tasks):
+            results[index] = ok
+        return results
+
+    def __run(self, tasks: List[Tuple[Any, List[_Item]]]) -> Iterable[Tuple[int, bool]]:
+        verify = self.__verify
+        executor = self.__executor
+        if executor is None or len(tasks) < 2:
+            for key, items in tasks:
+                yield from _verify_items(verify, key, items)
+            return
+        futures = [executor.submit(_verify_items, verify, key, items) for key, items in tasks]
+        for future in futures:
+            yield from future.result()
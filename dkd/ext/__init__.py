@@ -35,6 +35,12 @@ from ..protocol.instant import InstantMessageHelper
 from ..protocol.secure import SecureMessageHelper
 from ..protocol.reliable import ReliableMessageHelper
 
+from ..protocol.content import AsyncContentHelper
+from ..protocol.envelope import AsyncEnvelopeHelper
+from ..protocol.instant import AsyncInstantMessageHelper
+from ..protocol.secure import AsyncSecureMessageHelper
+from ..protocol.reliable import AsyncReliableMessageHelper
+
 from ..protocol.content import ContentExtension
 from ..protocol.instant import InstantMessageExtension
 from ..protocol.secure import SecureMessageExtension
@@ -43,6 +49,11 @@ from ..protocol.envelope import MessageExtensions, shared_message_extensions
 
 from .msg import GeneralMessageHelper, GeneralMessageExtension
 
+from .content import ContentGeneralFactory
+from .cache import ParseCache, CachedContentHelper, CachedEnvelopeHelper
+from .aio import AsyncMessageHelper
+from .metrics import HelperMetrics
+
 
 __all__ = [
 
@@ -53,6 +64,9 @@ __all__ = [
     'ContentHelper', 'EnvelopeHelper',
     'InstantMessageHelper', 'SecureMessageHelper', 'ReliableMessageHelper',
 
+    'AsyncContentHelper', 'AsyncEnvelopeHelper',
+    'AsyncInstantMessageHelper', 'AsyncSecureMessageHelper', 'AsyncReliableMessageHelper',
+
     'ContentExtension',
     'InstantMessageExtension', 'SecureMessageExtension', 'ReliableMessageExtension',
     'MessageExtensions', 'shared_message_extensions',
@@ -63,4 +77,13 @@ __all__ = [
 
     'GeneralMessageHelper', 'GeneralMessageExtension',
 
+    #
+    #   Reference Helpers
+    #
+
+    'ContentGeneralFactory',
+    'ParseCache', 'CachedContentHelper', 'CachedEnvelopeHelper',
+    'AsyncMessageHelper',
+    'HelperMetrics',
+
 ]
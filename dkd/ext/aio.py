@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Optional, Any, Callable
+
+from mkm.types import DateTime
+from mkm.protocol import ID
+
+from ..protocol import Content, Envelope
+from ..protocol import InstantMessage, SecureMessage, ReliableMessage
+from ..protocol.content import AsyncContentHelper
+from ..protocol.envelope import AsyncEnvelopeHelper
+from ..protocol.instant import AsyncInstantMessageHelper
+from ..protocol.secure import AsyncSecureMessageHelper
+from ..protocol.reliable import AsyncReliableMessageHelper
+from ..protocol.envelope import shared_message_extensions
+
+
+class AsyncMessageHelper(AsyncContentHelper, AsyncEnvelopeHelper,
+                         AsyncInstantMessageHelper, AsyncSecureMessageHelper, AsyncReliableMessageHelper):
+    """ Async helper for all messages
+
+        Calls the sync helpers (and their factories) in the executor,
+        so the factories registered for sync mode serve both models,
+        and slow factories won't block the event loop.
+
+        usage:
+
+            helper = AsyncMessageHelper()
+            ext = shared_message_extensions
+            ext.async_content_helper = helper
+            ext.async_envelope_helper = helper
+            ext.async_instant_helper = helper
+            ext.async_secure_helper = helper
+            ext.async_reliable_helper = helper
+    """
+
+    def __init__(self, executor: Optional[Executor] = None):
+        """
+        Create async helper
+
+        :param executor: executor for the sync helpers, None for the default one of the loop
+        """
+        super().__init__()
+        self.__executor = executor
+
+    @property
+    def executor(self) -> Optional[Executor]:
+        return self.__executor
+
+    async def _run(self, fn: Callable, *args) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.__executor, fn, *args)
+
+    #
+    #   Content
+    #
+
+    # Override
+    async def parse_content(self, content: Any) -> Optional[Content]:
+        if content is None:
+            return None
+        elif isinstance(content, Content):
+            return content
+        helper = shared_message_extensions.content_helper
+        return await self._run(helper.parse_content, content)
+
+    #
+    #   Envelope
+    #
+
+    # Override
+    async def create_envelope(self, sender: ID, receiver: ID, time: Optional[DateTime]) -> Envelope:
+        helper = shared_message_extensions.envelope_helper
+        return await self._run(helper.create_envelope, sender, receiver, time)
+
+    # Override
+    async def parse_envelope(self, envelope: Any) -> Optional[Envelope]:
+        if envelope is None:
+            return None
+        elif isinstance(envelope, Envelope):
+            return envelope
+        helper = shared_message_extensions.envelope_helper
+        return await self._run(helper.parse_envelope, envelope)
+
+    #
+    #   Instant Message
+    #
+
+    # Override
+    async def create_instant_message(self, head: Envelope, body: Content) -> InstantMessage:
+        helper = shared_message_extensions.instant_helper
+        return await self._run(helper.create_instant_message, head, body)
+
+    # Override
+    async def parse_instant_message(self, msg: Any) -> Optional[InstantMessage]:
+        if msg is None:
+            return None
+        elif isinstance(msg, InstantMessage):
+            return msg
+        helper = shared_message_extensions.instant_helper
+        return await self._run(helper.parse_instant_message, msg)
+
+    #
+    #   Secure Message
+    #
+
+    # Override
+    async def parse_secure_message(self, msg: Any) -> Optional[SecureMessage]:
+        if msg is None:
+            return None
+        elif isinstance(msg, SecureMessage):
+            return msg
+        helper = shared_message_extensions.secure_helper
+        return await self._run(helper.parse_secure_message, msg)
+
+    #
+    #   Reliable Message
+    #
+
+    # Override
+    async def parse_reliable_message(self, msg: Any) -> Optional[ReliableMessage]:
+        if msg is None:
+            return None
+        elif isinstance(msg, ReliableMessage):
+            return msg
+        helper = shared_message_extensions.reliable_helper
+        return await self._run(helper.parse_reliable_message, msg)
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Optional, Any, Dict
+
+from mkm.types import Mapper
+from mkm.types import DateTime
+from mkm.protocol import ID
+
+from ..protocol import Content, ContentFactory
+from ..protocol import Envelope, EnvelopeFactory
+from ..protocol.content import ContentHelper
+from ..protocol.envelope import EnvelopeHelper
+
+
+class ParseCache:
+    """ Bounded cache for parsed objects
+
+        Keyed by the identity of the underlying map, so parsing the same
+        dict again returns the object created before;
+        the entry is checked with 'obj.to_map() is map' before using,
+        and the least recently used entries are evicted when full.
+
+        By default the entries are strong references, so the objects (and
+        their maps) stay alive until evicted, which lets 'parse, discard,
+        parse again' callers hit; in weak mode, the cache only holds weak
+        references to the parsed objects, hitting only while they're alive.
+    """
+
+    def __init__(self, maxsize: int = 1024, weak: bool = False):
+        super().__init__()
+        self.__maxsize = maxsize
+        self.__weak = weak
+        # id(map) => object (or weak reference)
+        self.__entries: OrderedDict = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self.__maxsize
+
+    def get(self, info: dict) -> Optional[Any]:
+        """ Get the object parsed from this map """
+        key = id(info)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                obj = entry() if type(entry) is weakref.ref else entry
+                if obj is not None and obj.to_map() is info:
+                    self.__entries.move_to_end(key)
+                    self.__hits += 1
+                    return obj
+                # dead reference, or the map id was reused
+                del self.__entries[key]
+            self.__misses += 1
+
+    def put(self, info: dict, obj: Any):
+        """ Cache the object parsed from this map """
+        if obj is None or obj.to_map() is not info:
+            # the object doesn't wrap this map
+            return
+        entry = obj
+        if self.__weak:
+            try:
+                entry = weakref.ref(obj)
+            except TypeError:
+                # not weak referenceable, keep it
+                pass
+        key = id(info)
+        with self.__lock:
+            entries = self.__entries
+            entries[key] = entry
+            entries.move_to_end(key)
+            while len(entries) > self.__maxsize:
+                entries.popitem(last=False)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    #
+    #   Statistics
+    #
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """ hits, misses, size & maxsize """
+        return {
+            'hits': self.__hits,
+            'misses': self.__misses,
+            'size': len(self.__entries),
+            'maxsize': self.__maxsize,
+        }
+
+    def reset_stats(self):
+        self.__hits = 0
+        self.__misses = 0
+
+
+def _raw_map(info: Any) -> Optional[dict]:
+    """ get the underlying dict, or None if not cacheable """
+    if isinstance(info, Mapper):
+        info = info.to_map()
+    if isinstance(info, dict):
+        return info
+
+
+class CachedContentHelper(ContentHelper):
+    """ Content helper with parse cache
+
+        Wraps another content helper, usage:
+
+            helper = shared_message_extensions.content_helper
+            shared_message_extensions.content_helper = CachedContentHelper(helper)
+    """
+
+    def __init__(self, helper: ContentHelper, cache: Optional[ParseCache] = None):
+        super().__init__()
+        if cache is None:
+            cache = ParseCache()
+        self.__helper = helper
+        self.__cache = cache
+
+    @property
+    def helper(self) -> ContentHelper:
+        return self.__helper
+
+    @property
+    def cache(self) -> ParseCache:
+        return self.__cache
+
+    # Override
+    def set_content_factory(self, msg_type: str, factory: ContentFactory):
+        self.__helper.set_content_factory(msg_type, factory)
+        # the new factory may parse the maps differently
+        self.__cache.clear()
+
+    # Override
+    def get_content_factory(self, msg_type: str) -> Optional[ContentFactory]:
+        return self.__helper.get_content_factory(msg_type)
+
+    # Override
+    def parse_content(self, content: Any) -> Optional[Content]:
+        if content is None:
+            return None
+        elif isinstance(content, Content):
+            return content
+        info = _raw_map(content)
+        if info is None:
+            return self.__helper.parse_content(content)
+        cache = self.__cache
+        obj = cache.get(info)
+        if obj is None:
+            obj = self.__helper.parse_content(content)
+            cache.put(info, obj)
+        return obj
+
+
+class CachedEnvelopeHelper(EnvelopeHelper):
+    """ Envelope helper with parse cache
+
+        Wraps another envelope helper, usage:
+
+            helper = shared_message_extensions.envelope_helper
+            shared_message_extensions.envelope_helper = CachedEnvelopeHelper(helper)
+    """
+
+    def __init__(self, helper: EnvelopeHelper, cache: Optional[ParseCache] = None):
+        super().__init__()
+        if cache is None:
+            cache = ParseCache()
+        self.__helper = helper
+        self.__cache = cache
+
+    @property
+    def helper(self) -> EnvelopeHelper:
+        return self.__helper
+
+    @property
+    def cache(self) -> ParseCache:
+        return self.__cache
+
+    # Override
+    def set_envelope_factory(self, factory: EnvelopeFactory):
+        self.__helper.set_envelope_factory(factory)
+        self.__cache.clear()
+
+    # Override
+    def get_envelope_factory(self) -> Optional[EnvelopeFactory]:
+        return self.__helper.get_envelope_factory()
+
+    # Override
+    def create_envelope(self, sender: ID, receiver: ID, time: Optional[DateTime]) -> Envelope:
+        return self.__helper.create_envelope(sender=sender, receiver=receiver, time=time)
+
+    # Override
+    def parse_envelope(self, envelope: Any) -> Optional[Envelope]:
+        if envelope is None:
+            return None
+        elif isinstance(envelope, Envelope):
+            return envelope
+        info = _raw_map(envelope)
+        if info is None:
+            return self.__helper.parse_envelope(envelope)
+        cache = self.__cache
+        obj = cache.get(info)
+        if obj is None:
+            obj = self.__helper.parse_envelope(envelope)
+            cache.put(info, obj)
+        return obj
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+from typing import Optional, Union, Any, Tuple, Dict
+
+from mkm.types import StrMap
+from mkm.types import Wrapper
+
+from ..protocol import Content, ContentFactory
+from ..protocol.content import ContentHelper
+from ..protocol.envelope import shared_message_extensions
+
+
+def normalize_type(msg_type: Union[int, str]) -> str:
+    """ Get the canonical type string: 1, '1', '01' => '1' """
+    if isinstance(msg_type, int) and not isinstance(msg_type, bool):
+        return '%d' % msg_type
+    msg_type = str(msg_type).strip()
+    # only ASCII digits, 'isdigit()' is also true for '²', which 'int()' rejects
+    if msg_type.isascii() and msg_type.isdigit():
+        return '%d' % int(msg_type)
+    return msg_type
+
+
+class ContentGeneralFactory(ContentHelper):
+    """ Content helper with dispatch table
+
+        Factories are registered by the normalized type string,
+        the raw 'type' values (int or str) seen in content maps
+        are resolved once and then dispatched with a single lookup;
+        a hit counter is kept for each type.
+
+        The factory for type '*' will be used for unknown types.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # normalized type => factory
+        self.__factories: Dict[str, ContentFactory] = {}
+        # raw type value => (normalized type, factory)
+        self.__str_table: Dict[str, Tuple[str, ContentFactory]] = {}
+        self.__int_table: Dict[int, Tuple[str, ContentFactory]] = {}
+        # normalized type => count
+        self.__hits: Dict[str, int] = {}
+
+    # Override
+    def set_content_factory(self, msg_type: Union[int, str], factory: ContentFactory):
+        self.__factories[normalize_type(msg_type)] = factory
+        self.__rebuild()
+
+    # Override
+    def get_content_factory(self, msg_type: Union[int, str]) -> Optional[ContentFactory]:
+        return self.__factories.get(normalize_type(msg_type))
+
+    def __rebuild(self):
+        """ precompute the dispatch tables """
+        str_table = {}
+        int_table = {}
+        for key, factory in self.__factories.items():
+            entry = (key, factory)
+            str_table[key] = entry
+            if key.isascii() and key.isdigit():
+                int_table[int(key)] = entry
+        self.__str_table = str_table
+        self.__int_table = int_table
+
+    def __resolve(self, msg_type: Any) -> Optional[Tuple[str, ContentFactory]]:
+        """ resolve other forms of type value: ' 01', '*', ... """
+        key = normalize_type(msg_type)
+        factory = self.__factories.get(key)
+        if factory is not None:
+            # the canonical forms are already in the dispatch tables,
+            # aliases are not cached, so random spellings ('01', '001', ...)
+            # won't grow the tables
+            return key, factory
+        # unknown type, use default factory
+        # (counted as '*', so random types won't grow the counter)
+        factory = self.__factories.get('*')
+        if factory is not None:
+            return '*', factory
+
+    def __dispatch(self, info: StrMap) -> Optional[Tuple[str, ContentFactory]]:
+        msg_type = info.get('type')
+        # fast path
+        if type(msg_type) is str:
+            entry = self.__str_table.get(msg_type)
+        elif type(msg_type) is int:
+            entry = self.__int_table.get(msg_type)
+        else:
+            # other form (or missing), get type via the general helper
+            helper = shared_message_extensions.helper
+            if helper is not None:
+                msg_type = helper.get_content_type(info, '')
+            if msg_type is None:
+                msg_type = ''
+            entry = None
+        if entry is None:
+            entry = self.__resolve(msg_type)
+        return entry
+
+    # Override
+    def parse_content(self, content: Any) -> Optional[Content]:
+        if content is None:
+            return None
+        elif isinstance(content, Content):
+            return content
+        info = Wrapper.get_map(content)
+        if info is None:
+            # assert False, f'content error: {content}'
+            return None
+        entry = self.__dispatch(info)
+        if entry is None:
+            # assert False, f'content factory not found: {content}'
+            return None
+        key, factory = entry
+        hits = self.__hits
+        hits[key] = hits.get(key, 0) + 1
+        return factory.parse_content(content=info)
+
+    #
+    #   Statistics
+    #
+
+    @property
+    def hit_counts(self) -> Dict[str, int]:
+        """ parsed count for each content type """
+        return dict(self.__hits)
+
+    def reset_hit_counts(self):
+        self.__hits = {}
@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+import threading
+from bisect import bisect_left
+from collections.abc import Mapping
+from time import perf_counter
+from typing import Optional, Any, Callable, Iterable, List, Dict, Tuple
+
+from mkm.types import DateTime
+from mkm.types import Mapper
+from mkm.protocol import ID
+
+from ..protocol import Content, ContentFactory
+from ..protocol import Envelope, EnvelopeFactory
+from ..protocol import InstantMessage, InstantMessageFactory
+from ..protocol import SecureMessage, SecureMessageFactory
+from ..protocol import ReliableMessage, ReliableMessageFactory
+from ..protocol.content import ContentHelper
+from ..protocol.envelope import EnvelopeHelper
+from ..protocol.instant import InstantMessageHelper
+from ..protocol.secure import SecureMessageHelper
+from ..protocol.reliable import ReliableMessageHelper
+from ..protocol.envelope import MessageExtensions, shared_message_extensions
+
+from .content import normalize_type
+
+
+# upper bounds of the latency buckets (seconds)
+DEFAULT_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+                   0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+
+class _Stats:
+    """ stats for one operation """
+
+    __slots__ = ('count', 'failures', 'errors', 'total', 'buckets')
+
+    def __init__(self, size: int):
+        super().__init__()
+        self.count = 0
+        self.failures = 0   # returned None
+        self.errors = 0     # raised exception
+        self.total = 0.0    # seconds
+        self.buckets = [0] * (size + 1)
+
+
+class HelperMetrics:
+    """ Instrumentation for message helpers
+
+        Records call counts, latency histograms, failures (None results)
+        and errors (exceptions) for each helper method, and the counts of
+        parsed content for each type.
+
+        usage:
+
+            metrics = HelperMetrics()
+            metrics.install()   # wrap the helpers in message extensions
+            ...
+            print(metrics.to_prometheus())
+            metrics.uninstall() # restore the helpers, no cost any more
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__()
+        self.__bounds = tuple(sorted(buckets))
+        self.__lock = threading.Lock()
+        self.__ops: Dict[str, _Stats] = {}
+        # content type => [count, failures]
+        self.__types: Dict[str, List[int]] = {}
+
+    def record(self, op: str, elapsed: float, failed: bool = False, error: bool = False):
+        with self.__lock:
+            stats = self.__ops.get(op)
+            if stats is None:
+                stats = _Stats(len(self.__bounds))
+                self.__ops[op] = stats
+            stats.count += 1
+            stats.total += elapsed
+            stats.buckets[bisect_left(self.__bounds, elapsed)] += 1
+            if failed:
+                stats.failures += 1
+            if error:
+                stats.errors += 1
+
+    def record_type(self, msg_type: str, failed: bool):
+        with self.__lock:
+            counter = self.__types.get(msg_type)
+            if counter is None:
+                counter = [0, 0]
+                self.__types[msg_type] = counter
+            counter[0] += 1
+            if failed:
+                counter[1] += 1
+
+    def call(self, op: str, fn: Callable, *args, **kwargs) -> Any:
+        """ Call the function and record it """
+        start = perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self.record(op, perf_counter() - start, error=True)
+            raise
+        self.record(op, perf_counter() - start, failed=result is None)
+        return result
+
+    def reset(self):
+        with self.__lock:
+            self.__ops = {}
+            self.__types = {}
+
+    #
+    #   Install
+    #
+
+    def install(self, ext: MessageExtensions = None):
+        """ Wrap all helpers in the message extensions """
+        if ext is None:
+            ext = shared_message_extensions
+        for name, clazz in _WRAPPERS:
+            helper = getattr(ext, name, None)
+            if helper is None or isinstance(helper, _MeteredHelper):
+                continue
+            setattr(ext, name, clazz(helper=helper, metrics=self))
+
+    def uninstall(self, ext: MessageExtensions = None):
+        """ Restore the helpers wrapped by this """
+        if ext is None:
+            ext = shared_message_extensions
+        for name, _ in _WRAPPERS:
+            helper = getattr(ext, name, None)
+            if isinstance(helper, _MeteredHelper) and helper.metrics is self:
+                setattr(ext, name, helper.helper)
+
+    #
+    #   Export
+    #
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self.__lock:
+            ops = {}
+            for op, stats in self.__ops.items():
+                buckets = {}
+                cumulative = 0
+                for bound, count in zip(self.__bounds, stats.buckets):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                buckets['+Inf'] = stats.count
+                ops[op] = {
+                    'count': stats.count,
+                    'failures': stats.failures,
+                    'errors': stats.errors,
+                    'sum': stats.total,
+                    'buckets': buckets,
+                }
+            types = {key: {'count': value[0], 'failures': value[1]} for key, value in self.__types.items()}
+        return {
+            'operations': ops,
+            'content_types': types,
+        }
+
+    def to_prometheus(self, prefix: str = 'dkd') -> str:
+        """ Prometheus text format """
+        info = self.to_dict()
+        lines = [
+            f'# HELP {prefix}_helper_call_seconds Latency of message helper calls.',
+            f'# TYPE {prefix}_helper_call_seconds histogram',
+        ]
+        for op, stats in info['operations'].items():
+            for bound, count in stats['buckets'].items():
+                lines.append(f'{prefix}_helper_call_seconds_bucket{{op="{op}",le="{bound}"}} {count}')
+            lines.append(f'{prefix}_helper_call_seconds_sum{{op="{op}"}} {stats["sum"]}')
+            lines.append(f'{prefix}_helper_call_seconds_count{{op="{op}"}} {stats["count"]}')
+        for name, desc in (('failures', 'returned None'), ('errors', 'raised exception')):
+            lines.append(f'# HELP {prefix}_helper_{name}_total Message helper calls {desc}.')
+            lines.append(f'# TYPE {prefix}_helper_{name}_total counter')
+            for op, stats in info['operations'].items():
+                lines.append(f'{prefix}_helper_{name}_total{{op="{op}"}} {stats[name]}')
+        lines.append(f'# HELP {prefix}_content_parsed_total Contents parsed by type.')
+        lines.append(f'# TYPE {prefix}_content_parsed_total counter')
+        for msg_type, stats in info['content_types'].items():
+            lines.append(f'{prefix}_content_parsed_total{{type="{_escape(msg_type)}"}} {stats["count"]}')
+        lines.append(f'# HELP {prefix}_content_failures_total Contents failed to parse by type.')
+        lines.append(f'# TYPE {prefix}_content_failures_total counter')
+        for msg_type, stats in info['content_types'].items():
+            lines.append(f'{prefix}_content_failures_total{{type="{_escape(msg_type)}"}} {stats["failures"]}')
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _content_type(content: Any) -> Optional[str]:
+    if isinstance(content, Mapper):
+        content = content.to_map()
+    if isinstance(content, Mapping):
+        msg_type = content.get('type')
+        if msg_type is not None:
+            return normalize_type(msg_type)
+
+
+class _MeteredHelper:
+
+    def __init__(self, helper: Any, metrics: HelperMetrics):
+        super().__init__()
+        self.__helper = helper
+        self.__metrics = metrics
+
+    @property
+    def helper(self) -> Any:
+        """ the original helper """
+        return self.__helper
+
+    @property
+    def metrics(self) -> HelperMetrics:
+        return self.__metrics
+
+
+class MeteredContentHelper(_MeteredHelper, ContentHelper):
+    """ Content types without registered factory are counted as '*',
+        so the label values are bounded by the registered types.
+    """
+
+    # Override
+    def set_content_factory(self, msg_type: str, factory: ContentFactory):
+        self.helper.set_content_factory(msg_type, factory)
+
+    # Override
+    def get_content_factory(self, msg_type: str) -> Optional[ContentFactory]:
+        return self.helper.get_content_factory(msg_type)
+
+    # Override
+    def parse_content(self, content: Any) -> Optional[Content]:
+        metrics = self.metrics
+        result = metrics.call('parse_content', self.helper.parse_content, content)
+        metrics.record_type(self.__label(content), failed=result is None)
+        return result
+
+    def __label(self, content: Any) -> str:
+        msg_type = _content_type(content)
+        if msg_type is None or self.helper.get_content_factory(msg_type) is None:
+            return '*'
+        return msg_type
+
+
+class MeteredEnvelopeHelper(_MeteredHelper, EnvelopeHelper):
+
+    # Override
+    def set_envelope_factory(self, factory: EnvelopeFactory):
+        self.helper.set_envelope_factory(factory)
+
+    # Override
+    def get_envelope_factory(self) -> Optional[EnvelopeFactory]:
+        return self.helper.get_envelope_factory()
+
+    # Override
+    def create_envelope(self, sender: ID, receiver: ID, time: Optional[DateTime]) -> Envelope:
+        return self.metrics.call('create_envelope', self.helper.create_envelope, sender, receiver, time)
+
+    # Override
+    def parse_envelope(self, envelope: Any) -> Optional[Envelope]:
+        return self.metrics.call('parse_envelope', self.helper.parse_envelope, envelope)
+
+
+class MeteredInstantMessageHelper(_MeteredHelper, InstantMessageHelper):
+
+    # Override
+    def set_instant_message_factory(self, factory: InstantMessageFactory):
+        self.helper.set_instant_message_factory(factory)
+
+    # Override
+    def get_instant_message_factory(self) -> Optional[InstantMessageFactory]:
+        return self.helper.get_instant_message_factory()
+
+    # Override
+    def generate_serial_number(self, msg_type: Optional[str], now: Optional[DateTime]) -> int:
+        return self.metrics.call('generate_serial_number', self.helper.generate_serial_number, msg_type, now)
+
+    # Override
+    def create_instant_message(self, head: Envelope, body: Content) -> InstantMessage:
+        return self.metrics.call('create_instant_message', self.helper.create_instant_message, head, body)
+
+    # Override
+    def parse_instant_message(self, msg: Any) -> Optional[InstantMessage]:
+        return self.metrics.call('parse_instant_message', self.helper.parse_instant_message, msg)
+
+
+class MeteredSecureMessageHelper(_MeteredHelper, SecureMessageHelper):
+
+    # Override
+    def set_secure_message_factory(self, factory: SecureMessageFactory):
+        self.helper.set_secure_message_factory(factory)
+
+    # Override
+    def get_secure_message_factory(self) -> Optional[SecureMessageFactory]:
+        return self.helper.get_secure_message_factory()
+
+    # Override
+    def parse_secure_message(self, msg: Any) -> Optional[SecureMessage]:
+        return self.metrics.call('parse_secure_message', self.helper.parse_secure_message, msg)
+
+
+class MeteredReliableMessageHelper(_MeteredHelper, ReliableMessageHelper):
+
+    # Override
+    def set_reliable_message_factory(self, factory: ReliableMessageFactory):
+        self.helper.set_reliable_message_factory(factory)
+
+    # Override
+    def get_reliable_message_factory(self) -> Optional[ReliableMessageFactory]:
+        return self.helper.get_reliable_message_factory()
+
+    # Override
+    def parse_reliable_message(self, msg: Any) -> Optional[ReliableMessage]:
+        return self.metrics.call('parse_reliable_message', self.helper.parse_reliable_message, msg)
+
+    # Override
+    def parse_reliable_messages(self, messages: Iterable, executor=None) -> List[Any]:
+        # parse each item via 'self.parse_reliable_message()', so it's recorded too
+        parse = super().parse_reliable_messages
+        return self.metrics.call('parse_reliable_messages', parse, messages, executor)
+
+
+# (extension attribute, wrapper class)
+_WRAPPERS: Tuple[Tuple[str, type], ...] = (
+    ('content_helper', MeteredContentHelper),
+    ('envelope_helper', MeteredEnvelopeHelper),
+    ('instant_helper', MeteredInstantMessageHelper),
+    ('secure_helper', MeteredSecureMessageHelper),
+    ('reliable_helper', MeteredReliableMessageHelper),
+)
@@ -0,0 +1,467 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+"""
+    Binary Wire Format
+    ~~~~~~~~~~~~~~~~~~
+
+        +------+---------+-----+--------+-------+-----+--------+-------+--
+        | 'DKD'| version | tag | length | value | tag | length | value | ...
+        +------+---------+-----+--------+-------+-----+--------+-------+--
+
+        length: unsigned LEB128 (varint)
+
+        tag  field        value
+        ---  -----------  ----------------------------------------------
+        1    sender       UTF-8 string
+        2    receiver     UTF-8 string
+        3    time         float64 (big-endian)
+        4    time         int64 (big-endian)
+        5    group        UTF-8 string
+        6    type         UTF-8 string
+        16   data         raw bytes (base64 decoded)
+        17   signature    raw bytes (base64 decoded)
+        18   keys         varint(len(ID)) + UTF-8 ID + raw key bytes
+        19   digest       raw bytes of 'keys.digest'
+        127  extra        JSON object of all the other fields
+
+    Any value that cannot be restored exactly from its binary form
+    (e.g. not a pure base64 string) is kept in the 'extra' JSON,
+    so converting between the map and the binary form is lossless.
+"""
+
+import struct
+from collections.abc import Mapping
+from typing import Optional, Union, Any, Iterator, Tuple, Dict
+
+from mkm.types import DateTime
+from mkm.types import StrMap, MutableStrMap
+from mkm.types import Mapper
+from mkm.format import Base64, JSONMap
+from mkm.format import TransportableData
+
+from ..protocol import Envelope
+from ..protocol import ReliableMessage
+from ..msg import NetworkMessage, NetworkMessageFactory
+
+
+MAGIC = b'DKD'
+VERSION = 1
+
+TAG_SENDER = 1
+TAG_RECEIVER = 2
+TAG_TIME_FLOAT = 3
+TAG_TIME_INT = 4
+TAG_GROUP = 5
+TAG_TYPE = 6
+TAG_DATA = 16
+TAG_SIGNATURE = 17
+TAG_KEY = 18
+TAG_DIGEST = 19
+TAG_EXTRA = 127
+
+_STRING_FIELDS = {
+    'sender': TAG_SENDER,
+    'receiver': TAG_RECEIVER,
+    'group': TAG_GROUP,
+    'type': TAG_TYPE,
+}
+_STRING_TAGS = {tag: key for key, tag in _STRING_FIELDS.items()}
+
+_FLOAT64 = struct.Struct('>d')
+_INT64 = struct.Struct('>q')
+_INT64_MIN = -0x8000000000000000
+_INT64_MAX = 0x7FFFFFFFFFFFFFFF
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+#
+#   Varint
+#
+
+def write_varint(buffer: bytearray, value: int):
+    """ Append unsigned LEB128 """
+    assert value >= 0, f'varint error: {value}'
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(view: memoryview, offset: int) -> Tuple[int, int]:
+    """ Read unsigned LEB128, return (value, next offset) """
+    value = 0
+    shift = 0
+    size = len(view)
+    while True:
+        if offset >= size:
+            raise ValueError('varint error: out of range')
+        byte = view[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def write_field(buffer: bytearray, tag: int, value: Buffer):
+    buffer.append(tag)
+    write_varint(buffer, len(value))
+    buffer += value
+
+
+def _raw_base64(value) -> Optional[bytes]:
+    """ Decode value that can be encoded back to the same string """
+    if isinstance(value, TransportableData):
+        return value.to_bytes()
+    elif not isinstance(value, str):
+        return None
+    try:
+        data = Base64.decode(value)
+    except ValueError:
+        return None
+    if data is not None and Base64.encode(data) == value:
+        return data
+
+
+class ReliableMessageCoder:
+    """ Binary coder for reliable message
+
+        Encode a message (or its map) to the binary form, and decode it
+        back to a message (or a map of pure strings for JSON peers).
+
+        With the lazy NetworkMessageFactory, the decoded message wraps the
+        memoryview slices of 'data' & 'signature' with TransportableData,
+        and base64-encodes them into its map only when the map is exported
+        (e.g. forwarding to JSON peers); encoding it to binary again writes
+        the raw bytes directly. Otherwise, the message is parsed from a map
+        of pure strings.
+    """
+
+    def encode(self, msg: Union[ReliableMessage, StrMap]) -> bytes:
+        if isinstance(msg, BinaryNetworkMessage):
+            # raw fields, without encoding them to base64
+            msg = msg.binary_map()
+        elif isinstance(msg, Mapper):
+            msg = msg.to_map()
+        buffer = bytearray(MAGIC)
+        buffer.append(VERSION)
+        extra = {}
+        for key, value in msg.items():
+            tag = _STRING_FIELDS.get(key)
+            if tag is not None and isinstance(value, str):
+                write_field(buffer, tag, value.encode('utf-8'))
+            elif key == 'time' and isinstance(value, float):
+                write_field(buffer, TAG_TIME_FLOAT, _FLOAT64.pack(value))
+            elif key == 'time' and isinstance(value, int) and not isinstance(value, bool) \
+                    and _INT64_MIN <= value <= _INT64_MAX:
+                write_field(buffer, TAG_TIME_INT, _INT64.pack(value))
+            elif key == 'data' or key == 'signature':
+                data = _raw_base64(value)
+                if data is None:
+                    extra[key] = value
+                else:
+                    write_field(buffer, TAG_DATA if key == 'data' else TAG_SIGNATURE, data)
+            elif key == 'keys' and isinstance(value, Mapping):
+                keys = _encode_keys(value)
+                if keys is None:
+                    extra[key] = value
+                else:
+                    buffer += keys
+            else:
+                extra[key] = value
+        if len(extra) > 0:
+            write_field(buffer, TAG_EXTRA, JSONMap.encode(extra).encode('utf-8'))
+        return bytes(buffer)
+
+    def decode(self, data: Buffer) -> Optional[ReliableMessage]:
+        """ Decode binary to message, sharing the buffer """
+        body = {}
+        info = self.__read(view=memoryview(data), body=body)
+        if info is None:
+            return None
+        factory = ReliableMessage.get_factory()
+        if isinstance(factory, NetworkMessageFactory) and factory.lazy:
+            return _lazy_message(info=info, body=body)
+        _encode_body(info=info, body=body)
+        return ReliableMessage.parse(msg=info)
+
+    def decode_map(self, data: Buffer) -> Optional[MutableStrMap]:
+        """
+        Decode binary to message map (JSON-clean)
+
+        :param data: binary form
+        :return: message info
+        :raise ValueError: when the binary form is truncated or broken
+        """
+        body = {}
+        info = self.__read(view=memoryview(data), body=body)
+        if info is not None:
+            _encode_body(info=info, body=body)
+        return info
+
+    def __read(self, view: memoryview, body: dict) -> Optional[MutableStrMap]:
+        size = len(view)
+        if size < 4 or view[:3] != MAGIC or view[3] != VERSION:
+            # not a binary message
+            return None
+        try:
+            return _read_fields(view=view, size=size, body=body)
+        except (IndexError, struct.error, UnicodeDecodeError) as error:
+            raise ValueError(f'binary message error: {error}')
+
+
+def _read_fields(view: memoryview, size: int, body: dict) -> MutableStrMap:
+    info = {}
+    keys = None
+    offset = 4
+    while offset < size:
+        tag = view[offset]
+        length, offset = read_varint(view, offset + 1)
+        end = offset + length
+        if end > size:
+            raise ValueError(f'binary message error: field {tag} out of range')
+        value = view[offset:end]
+        offset = end
+        key = _STRING_TAGS.get(tag)
+        if key is not None:
+            info[key] = str(value, 'utf-8')
+        elif tag == TAG_TIME_FLOAT:
+            info['time'] = _FLOAT64.unpack(value)[0]
+        elif tag == TAG_TIME_INT:
+            info['time'] = _INT64.unpack(value)[0]
+        elif tag == TAG_DATA or tag == TAG_SIGNATURE:
+            name = 'data' if tag == TAG_DATA else 'signature'
+            body[name] = TransportableData.create(data=value)
+        elif tag == TAG_KEY:
+            id_len, start = read_varint(value, 0)
+            if start + id_len > length:
+                raise ValueError('binary message error: key ID out of range')
+            identifier = str(value[start:start + id_len], 'utf-8')
+            if keys is None:
+                keys = {}
+            keys[identifier] = _base64_string(value[start + id_len:])
+        elif tag == TAG_DIGEST:
+            if keys is None:
+                keys = {}
+            keys['digest'] = _base64_string(value)
+        elif tag == TAG_EXTRA:
+            info.update(JSONMap.decode(str(value, 'utf-8')))
+        # else:
+        #     unknown field, skip it
+    if keys is not None:
+        info['keys'] = keys
+    return info
+
+
+def _encode_body(info: MutableStrMap, body: Dict[str, TransportableData]):
+    """ put base64 strings of 'data' & 'signature' into the map """
+    for key, ted in body.items():
+        info[key] = ted.serialize()
+
+
+def _lazy_message(info: MutableStrMap, body: Dict[str, TransportableData]) -> Optional[ReliableMessage]:
+    """ same checks as NetworkMessageFactory in routing mode """
+    data = body.get('data')
+    signature = body.get('signature')
+    if 'sender' not in info or data is None or signature is None:
+        return None
+    head = Envelope.parse(envelope=info)
+    if head is None or head.sender is None or head.receiver is None:
+        return None
+    _ = head.group
+    _ = head.type
+    return BinaryNetworkMessage(msg=info, head=head, data=data, signature=signature)
+
+
+def _encode_keys(keys: StrMap) -> Optional[bytearray]:
+    if len(keys) == 0:
+        # empty map has no binary form, keep it in 'extra'
+        return None
+    buffer = bytearray()
+    for identifier, value in keys.items():
+        data = _raw_base64(value)
+        if data is None or not isinstance(identifier, str):
+            return None
+        elif identifier == 'digest':
+            write_field(buffer, TAG_DIGEST, data)
+            continue
+        name = identifier.encode('utf-8')
+        field = bytearray()
+        write_varint(field, len(name))
+        field += name
+        field += data
+        write_field(buffer, TAG_KEY, field)
+    return buffer
+
+
+def _base64_string(value: memoryview) -> str:
+    return Base64.encode(bytes(value))
+
+
+class BinaryNetworkMessage(NetworkMessage):
+    """ Reliable message decoded from binary
+
+        The 'data' & 'signature' are kept as TransportableData wrapping the
+        input buffer, they're base64-encoded into the map only when it's
+        read or exported ('to_map()', 'copy_map()', iterating, ...).
+    """
+
+    __slots__ = ('__pending',)
+
+    def __init__(self, msg: MutableStrMap, head: Envelope,
+                 data: TransportableData, signature: TransportableData):
+        super().__init__(msg=msg, head=head)
+        self.preload(data=data, signature=signature)
+        # fields not encoded into the map yet
+        self.__pending: Optional[Dict[str, TransportableData]] = {'data': data, 'signature': signature}
+
+    def binary_map(self) -> StrMap:
+        """ Get fields with the raw 'data' & 'signature', without encoding """
+        pending = self.__pending
+        info = super().to_map()
+        if pending is None:
+            return info
+        fields = dict(info)
+        fields.update(pending)
+        return fields
+
+    def __flush(self):
+        """ encode the pending fields into the map """
+        pending = self.__pending
+        if pending is not None:
+            self.__pending = None
+            _encode_body(info=super().to_map(), body=pending)
+
+    def __touch(self, key: str):
+        pending = self.__pending
+        if pending is not None and key in pending:
+            self.__flush()
+
+    # Override
+    def to_map(self) -> MutableStrMap:
+        self.__flush()
+        return super().to_map()
+
+    # Override
+    def copy_map(self, deep_copy: bool = False) -> MutableStrMap:
+        self.__flush()
+        return super().copy_map(deep_copy=deep_copy)
+
+    # Override
+    def get_str(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        self.__touch(key)
+        return super().get_str(key=key, default=default)
+
+    # Override
+    def get_bool(self, key: str, default: Optional[bool] = None) -> Optional[bool]:
+        self.__touch(key)
+        return super().get_bool(key=key, default=default)
+
+    # Override
+    def get_int(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        self.__touch(key)
+        return super().get_int(key=key, default=default)
+
+    # Override
+    def get_float(self, key: str, default: Optional[float] = None) -> Optional[float]:
+        self.__touch(key)
+        return super().get_float(key=key, default=default)
+
+    # Override
+    def get_datetime(self, key: str, default: Optional[DateTime] = None) -> Optional[DateTime]:
+        self.__touch(key)
+        return super().get_datetime(key=key, default=default)
+
+    #
+    #   Mapping
+    #
+
+    # Override
+    def __getitem__(self, key: str) -> Any:
+        self.__touch(key)
+        return super().__getitem__(key)
+
+    # Override
+    def __setitem__(self, key: str, value: Any):
+        pending = self.__pending
+        if pending is not None:
+            # the new value wins
+            pending.pop(key, None)
+        super().__setitem__(key, value)
+
+    # Override
+    def __delitem__(self, key: str):
+        self.__touch(key)
+        super().__delitem__(key)
+
+    # Override
+    def __iter__(self) -> Iterator[str]:
+        self.__flush()
+        return super().__iter__()
+
+    # Override
+    def __len__(self) -> int:
+        self.__flush()
+        return super().__len__()
+
+    # Override
+    def __contains__(self, key: Any) -> bool:
+        pending = self.__pending
+        if pending is not None and key in pending:
+            return True
+        return super().__contains__(key)
+
+    # Override
+    def get(self, key: str, default: Any = None) -> Any:
+        self.__touch(key)
+        return super().get(key, default)
+
+    # Override
+    def __eq__(self, other: Any) -> bool:
+        self.__flush()
+        return super().__eq__(other)
+
+    # Override
+    def __ne__(self, other: Any) -> bool:
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    # Override
+    def __str__(self) -> str:
+        self.__flush()
+        return super().__str__()
+
+    # Override
+    def __repr__(self) -> str:
+        self.__flush()
+        return super().__repr__()
@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+"""
+    Compact Envelope Format
+    ~~~~~~~~~~~~~~~~~~~~~~~
+
+        +-------+--------+----------+--------+-------+-------+-------+
+        | flags | sender | receiver |  time  | group | type  | extra |
+        +-------+--------+----------+--------+-------+-------+-------+
+
+        flags: 1 byte, which fields follow (in the order above)
+
+        0x01  sender    ID reference
+        0x02  receiver  ID reference
+        0x04  time      int64 (big-endian) milliseconds
+        0x08            time is integer seconds
+        0x10  group     ID reference
+        0x20  type      varint (for small integer types)
+        0x40  type      varint(length) + UTF-8 string
+        0x80  extra     varint(length) + JSON object of the other fields
+
+        ID reference: varint(index << 1) for ID in the table,
+                      varint(length << 1 | 1) + UTF-8 string for the others
+
+    An ID written as string will be appended to the table of both sides
+    (unless the table is frozen or full), so the repeated IDs in a
+    connection (or a file) take only 1 or 2 bytes after the first one;
+    for storage, a frozen table can be shared as the dictionary.
+"""
+
+import struct
+from typing import Optional, Union, Iterable, List, Dict, Tuple
+
+from mkm.types import StrMap, MutableStrMap
+from mkm.types import Mapper
+from mkm.format import JSONMap
+
+from ..protocol import Envelope
+
+from .binary import Buffer
+from .binary import write_varint, read_varint
+
+
+FLAG_SENDER = 0x01
+FLAG_RECEIVER = 0x02
+FLAG_TIME = 0x04
+FLAG_TIME_INT = 0x08
+FLAG_GROUP = 0x10
+FLAG_TYPE_INT = 0x20
+FLAG_TYPE_STR = 0x40
+FLAG_EXTRA = 0x80
+
+_INT64 = struct.Struct('>q')
+
+
+class IDTable:
+    """ Interned ID strings
+
+        IDs are numbered by the order they were added;
+        encoder & decoder must have the same table.
+    """
+
+    def __init__(self, ids: Iterable[str] = (), frozen: bool = False, max_size: int = 0xFFFF):
+        """
+        Create ID table
+
+        :param ids:      preloaded ID strings (shared dictionary)
+        :param frozen:   True to stop adding new IDs
+        :param max_size: stop adding new IDs when reached
+        """
+        super().__init__()
+        self.__ids: List[str] = []
+        self.__indexes: Dict[str, int] = {}
+        self.__max_size = max_size
+        self.__frozen = False
+        for name in ids:
+            self.add(name)
+        self.__frozen = frozen
+
+    @property
+    def frozen(self) -> bool:
+        return self.__frozen
+
+    @property
+    def ids(self) -> List[str]:
+        """ ID strings in order, for saving the dictionary """
+        return list(self.__ids)
+
+    def index(self, name: str) -> Optional[int]:
+        return self.__indexes.get(name)
+
+    def get(self, index: int) -> str:
+        return self.__ids[index]
+
+    def add(self, name: str) -> Optional[int]:
+        """ Append ID string, return its index (or None if frozen/full) """
+        index = self.__indexes.get(name)
+        if index is not None:
+            return index
+        elif self.__frozen or len(self.__ids) >= self.__max_size:
+            return None
+        index = len(self.__ids)
+        self.__ids.append(name)
+        self.__indexes[name] = index
+        return index
+
+    def __len__(self) -> int:
+        return len(self.__ids)
+
+
+class EnvelopeCoder:
+    """ Compact binary coder for envelope
+
+        Use one coder for each direction of a connection (or for a file),
+        and decode the envelopes in the same order they were encoded;
+        or share a frozen table for all.
+    """
+
+    def __init__(self, table: Optional[IDTable] = None):
+        super().__init__()
+        if table is None:
+            table = IDTable()
+        self.__table = table
+
+    @property
+    def table(self) -> IDTable:
+        return self.__table
+
+    def encode(self, env: Union[Envelope, StrMap]) -> bytes:
+        buffer = bytearray()
+        self.write(buffer, env=env)
+        return bytes(buffer)
+
+    def write(self, buffer: bytearray, env: Union[Envelope, StrMap]):
+        """ Append the binary form of envelope to the buffer """
+        if isinstance(env, Mapper):
+            env = env.to_map()
+        flags = 0
+        body = bytearray()
+        # new IDs written inline, added to the table after the whole envelope is written
+        new_ids: List[str] = []
+        sender = env.get('sender')
+        receiver = env.get('receiver')
+        time = env.get('time')
+        group = env.get('group')
+        msg_type = env.get('type')
+        extra = {}
+        if isinstance(sender, str):
+            flags |= FLAG_SENDER
+            self.__write_id(body, sender, new_ids=new_ids)
+        elif sender is not None:
+            extra['sender'] = sender
+        if isinstance(receiver, str):
+            flags |= FLAG_RECEIVER
+            self.__write_id(body, receiver, new_ids=new_ids)
+        elif receiver is not None:
+            extra['receiver'] = receiver
+        if time is not None:
+            millis = _time_millis(time)
+            if millis is None:
+                extra['time'] = time
+            else:
+                flags |= FLAG_TIME
+                if isinstance(time, int):
+                    flags |= FLAG_TIME_INT
+                body += _INT64.pack(millis)
+        if isinstance(group, str):
+            flags |= FLAG_GROUP
+            self.__write_id(body, group, new_ids=new_ids)
+        elif group is not None:
+            extra['group'] = group
+        if isinstance(msg_type, int) and not isinstance(msg_type, bool) and msg_type >= 0:
+            flags |= FLAG_TYPE_INT
+            write_varint(body, msg_type)
+        elif isinstance(msg_type, str):
+            flags |= FLAG_TYPE_STR
+            _write_string(body, msg_type)
+        elif msg_type is not None:
+            extra['type'] = msg_type
+        for key, value in env.items():
+            if key not in _FIELDS:
+                extra[key] = value
+        if len(extra) > 0:
+            flags |= FLAG_EXTRA
+            _write_string(body, JSONMap.encode(extra))
+        buffer.append(flags)
+        buffer += body
+        table = self.__table
+        for name in new_ids:
+            table.add(name)
+
+    def __write_id(self, buffer: bytearray, name: str, new_ids: List[str]):
+        index = self.__table.index(name)
+        if index is not None:
+            write_varint(buffer, index << 1)
+            return
+        # not in table yet (or pending), write it inline;
+        # the decoder ignores the repeated one when adding
+        data = name.encode('utf-8')
+        write_varint(buffer, (len(data) << 1) | 1)
+        buffer += data
+        new_ids.append(name)
+
+    def decode(self, data: Buffer) -> Optional[Envelope]:
+        info = self.decode_map(data=data)
+        if info is not None:
+            return Envelope.parse(envelope=info)
+
+    def decode_map(self, data: Buffer) -> Optional[MutableStrMap]:
+        view = memoryview(data)
+        if len(view) == 0:
+            return None
+        info, offset = self.read(view, 0)
+        return info
+
+    def read(self, view: memoryview, offset: int) -> Tuple[MutableStrMap, int]:
+        """ Read envelope map from the buffer, return (info, next offset) """
+        if offset >= len(view):
+            raise ValueError('envelope binary error: out of range')
+        flags = view[offset]
+        offset += 1
+        info = {}
+        if flags & FLAG_SENDER:
+            info['sender'], offset = self.__read_id(view, offset)
+        if flags & FLAG_RECEIVER:
+            info['receiver'], offset = self.__read_id(view, offset)
+        if flags & FLAG_TIME:
+            end = offset + _INT64.size
+            if end > len(view):
+                raise ValueError('envelope binary error: time out of range')
+            millis = _INT64.unpack(view[offset:end])[0]
+            offset = end
+            if flags & FLAG_TIME_INT:
+                info['time'] = millis // 1000
+            else:
+                info['time'] = millis / 1000.0
+        if flags & FLAG_GROUP:
+            info['group'], offset = self.__read_id(view, offset)
+        if flags & FLAG_TYPE_INT:
+            info['type'], offset = read_varint(view, offset)
+        elif flags & FLAG_TYPE_STR:
+            info['type'], offset = _read_string(view, offset)
+        if flags & FLAG_EXTRA:
+            text, offset = _read_string(view, offset)
+            info.update(JSONMap.decode(text))
+        if offset > len(view):
+            raise ValueError('envelope binary error: out of range')
+        return info, offset
+
+    def __read_id(self, view: memoryview, offset: int) -> Tuple[str, int]:
+        value, offset = read_varint(view, offset)
+        if value & 1 == 0:
+            index = value >> 1
+            if index >= len(self.__table):
+                raise ValueError(f'envelope binary error: ID index {index} not found')
+            return self.__table.get(index), offset
+        end = offset + (value >> 1)
+        # check before adding, a truncated ID must not get into the table
+        if end > len(view):
+            raise ValueError('envelope binary error: ID out of range')
+        name = str(view[offset:end], 'utf-8')
+        self.__table.add(name)
+        return name, end
+
+
+_FIELDS = {'sender', 'receiver', 'time', 'group', 'type'}
+
+
+def _time_millis(time) -> Optional[int]:
+    """ Get milliseconds for integer/float seconds """
+    if isinstance(time, bool):
+        return None
+    elif isinstance(time, int):
+        millis = time * 1000
+    elif isinstance(time, float):
+        millis = round(time * 1000)
+    else:
+        return None
+    if -0x8000000000000000 <= millis <= 0x7FFFFFFFFFFFFFFF:
+        return millis
+
+
+def _write_string(buffer: bytearray, text: str):
+    data = text.encode('utf-8')
+    write_varint(buffer, len(data))
+    buffer += data
+
+
+def _read_string(view: memoryview, offset: int) -> Tuple[str, int]:
+    length, offset = read_varint(view, offset)
+    end = offset + length
+    if end > len(view):
+        raise ValueError('envelope binary error: string out of range')
+    return str(view[offset:end], 'utf-8'), end
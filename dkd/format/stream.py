@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+"""
+    JSON Message Stream
+    ~~~~~~~~~~~~~~~~~~~
+
+        {"sender":"moki@xxx",...}{"sender":"hulk@yyy",...}
+        {"sender":"moki@xxx",...}\n{"sender":"hulk@yyy",...}
+        [{"sender":"moki@xxx",...},{"sender":"hulk@yyy",...}]
+
+    Messages are JSON objects one after another, the separators
+    (whitespaces, commas & square brackets) between them are ignored.
+"""
+
+import re
+from typing import Optional, Any, List, Iterator, AsyncIterator
+
+from mkm.format import JSONMap
+
+from ..protocol import ReliableMessage
+
+from .binary import Buffer
+
+
+# structural characters outside/inside a string
+_OUTSIDE = re.compile(rb'[{}"]')
+_INSIDE = re.compile(rb'["\\]')
+
+_BRACE_OPEN = 0x7B
+_QUOTE = 0x22
+
+
+class MessageStreamDecoder:
+    """ Incremental decoder for JSON message stream
+
+        Feed the bytes received, it scans each byte once to find the
+        boundaries of the messages, and returns the complete ones;
+        only the unfinished message stays in the buffer.
+
+        A message larger than 'max_size' will be dropped (skipped until
+        its end), so the buffer memory is bounded.
+    """
+
+    def __init__(self, max_size: int = 1024 * 1024):
+        super().__init__()
+        self.__max_size = max_size
+        self.__buffer = bytearray()
+        self.__pos = 0          # scanning position
+        self.__start = 0        # start of the current message
+        self.__depth = 0        # depth of braces
+        self.__in_string = False
+        self.__discarding = False
+        self.__dropped = 0
+
+    @property
+    def dropped(self) -> int:
+        """ count of the messages dropped (too large, or not valid JSON object) """
+        return self.__dropped
+
+    @property
+    def buffered(self) -> int:
+        """ size of the unfinished message """
+        return len(self.__buffer)
+
+    def reset(self):
+        self.__buffer = bytearray()
+        self.__pos = 0
+        self.__start = 0
+        self.__depth = 0
+        self.__in_string = False
+        self.__discarding = False
+
+    def feed(self, data: Buffer) -> List[ReliableMessage]:
+        """ Feed bytes, return the complete messages """
+        messages = []
+        for info in self.feed_maps(data=data):
+            msg = ReliableMessage.parse(msg=info)
+            if msg is None:
+                self.__dropped += 1
+            else:
+                messages.append(msg)
+        return messages
+
+    def feed_maps(self, data: Buffer) -> List[dict]:
+        """ Feed bytes, return the complete message maps """
+        buffer = self.__buffer
+        buffer += data
+        pos = self.__pos
+        start = self.__start
+        depth = self.__depth
+        in_string = self.__in_string
+        frames = []
+        while True:
+            if depth == 0:
+                # seek the next message
+                start = buffer.find(_BRACE_OPEN, pos)
+                if start < 0:
+                    pos = len(buffer)
+                    break
+                depth = 1
+                pos = start + 1
+            elif in_string:
+                match = _INSIDE.search(buffer, pos)
+                if match is None:
+                    # (the escaped char may be in the next chunk)
+                    pos = max(pos, len(buffer))
+                    break
+                elif buffer[match.start()] == _QUOTE:
+                    in_string = False
+                    pos = match.end()
+                else:
+                    # skip the escaped char
+                    pos = match.end() + 1
+            else:
+                match = _OUTSIDE.search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    break
+                pos = match.end()
+                char = buffer[match.start()]
+                if char == _QUOTE:
+                    in_string = True
+                elif char == _BRACE_OPEN:
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth > 0:
+                        continue
+                    elif self.__discarding:
+                        # end of the dropped message
+                        self.__discarding = False
+                        self.__dropped += 1
+                    else:
+                        frames.append(bytes(buffer[start:pos]))
+        # keep the unfinished message only
+        if depth == 0 or self.__discarding:
+            cut = min(pos, len(buffer))
+        else:
+            cut = start
+        del buffer[:cut]
+        pos -= cut
+        start = 0
+        if depth > 0 and not self.__discarding and len(buffer) > self.__max_size:
+            # message too large, drop it
+            self.__discarding = True
+            pos -= len(buffer)
+            buffer.clear()
+        self.__pos = pos
+        self.__start = start
+        self.__depth = depth
+        self.__in_string = in_string
+        return [info for info in map(self.__decode, frames) if info is not None]
+
+    def __decode(self, frame: bytes) -> Optional[dict]:
+        try:
+            info = JSONMap.decode(str(frame, 'utf-8'))
+        except ValueError:
+            info = None
+        if isinstance(info, dict):
+            return info
+        self.__dropped += 1
+
+    #
+    #   Streams
+    #
+
+    def iter_file(self, file: Any, chunk_size: int = 65536) -> Iterator[ReliableMessage]:
+        """ Read messages from a sync file object (binary or text) """
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            elif isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            for msg in self.feed(data=chunk):
+                yield msg
+
+    async def aiter_reader(self, reader: Any, chunk_size: int = 65536) -> AsyncIterator[ReliableMessage]:
+        """ Read messages from an asyncio.StreamReader """
+        while True:
+            chunk = await reader.read(chunk_size)
+            if not chunk:
+                break
+            for msg in self.feed(data=chunk):
+                yield msg
+
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+from typing import Optional, Any
+
+from mkm.types import DateTime
+from mkm.types import StrMap
+from mkm.protocol import ID
+
+from ..protocol import Envelope, Message
+
+from .dictionary import Dictionary
+
+
+_ENVELOPE_FIELDS = {'sender', 'receiver', 'time', 'group', 'type'}
+
+
+class BaseMessage(Dictionary, Message):
+    """ Message with envelope
+
+        The envelope shares the same inner map with the message,
+        it will be parsed on first access if not given; writing the
+        envelope fields through the message also updates the envelope.
+
+        data format: {
+            //-- envelope
+            "sender"   : "moki@xxx",
+            "receiver" : "hulk@yyy",
+            "time"     : 123.45,
+            //-- body
+            ...
+        }
+    """
+
+    __slots__ = ('__envelope',)
+
+    def __init__(self, msg: Optional[StrMap] = None, head: Optional[Envelope] = None):
+        if msg is None:
+            assert head is not None, 'message envelope should not be empty'
+            msg = head.copy_map(False)
+        super().__init__(dictionary=msg)
+        self.__envelope = head
+
+    @property  # Override
+    def envelope(self) -> Envelope:
+        head = self.__envelope
+        if head is None:
+            # let envelope share the same map with message
+            head = Envelope.parse(envelope=self.to_map())
+            assert head is not None, f'message envelope error: {self}'
+            self.__envelope = head
+        return head
+
+    @property  # Override
+    def sender(self) -> ID:
+        return self.envelope.sender
+
+    @property  # Override
+    def receiver(self) -> ID:
+        return self.envelope.receiver
+
+    @property  # Override
+    def time(self) -> Optional[DateTime]:
+        return self.envelope.time
+
+    @property  # Override
+    def group(self) -> Optional[ID]:
+        return self.envelope.group
+
+    @property  # Override
+    def type(self) -> Optional[str]:
+        return self.envelope.type
+
+    #
+    #   Mapping
+    #
+
+    # Override
+    def __setitem__(self, key: str, value: Any):
+        head = self.__envelope
+        if head is not None and key in _ENVELOPE_FIELDS:
+            if isinstance(head, Dictionary) and head.to_map() is self.to_map():
+                # write through the envelope, it drops the cached value
+                head[key] = value
+                return
+            # parse again from the map on next access
+            self.__envelope = None
+        super().__setitem__(key, value)
+
+    # Override
+    def __delitem__(self, key: str):
+        head = self.__envelope
+        if head is not None and key in _ENVELOPE_FIELDS:
+            if isinstance(head, Dictionary) and head.to_map() is self.to_map():
+                del head[key]
+                return
+            self.__envelope = None
+        super().__delitem__(key)
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+from typing import Optional, Union, Any, Dict
+
+from mkm.types import DateTime
+from mkm.types import StrMap
+from mkm.format import TransportableData
+from mkm.protocol import ID
+
+from ..protocol import Content
+from ..protocol import InstantMessage
+
+from .dictionary import Dictionary
+
+
+# not parsed yet
+_UNSET = object()
+
+
+class BaseContent(Dictionary, Content):
+    """ Content with lazy fields
+
+        The fields are parsed from the inner map on first access and
+        cached; large data fields (e.g. file data, image thumbnail) stay
+        as raw strings until 'get_data()' is called.
+
+        The data set by 'set_data()' are encoded into the map at once,
+        and the TransportableData objects are cached for 'get_data()'.
+
+        data format: {
+            "type"  : i2s(0),         // message type
+            "sn"    : 12345,          // serial number
+            "time"  : 123.45,         // message time
+            "group" : "{GroupID}",    // for group message
+            ...
+        }
+    """
+
+    __slots__ = ('__type', '__sn', '__time', '__group', '__fields')
+
+    def __init__(self, content: Optional[StrMap] = None, msg_type: Union[int, str, None] = None):
+        if content is None:
+            # create new content
+            assert msg_type is not None, 'content type should not be empty'
+            now = DateTime.now()
+            sn = InstantMessage.generate_serial_number(msg_type, now)
+            content = {
+                'type': msg_type,
+                'sn': sn,
+                'time': now.timestamp,
+            }
+            super().__init__(dictionary=content)
+            self.__sn = sn
+            self.__time = now
+        else:
+            # parse fields lazily
+            super().__init__(dictionary=content)
+            self.__sn = _UNSET
+            self.__time = _UNSET
+        self.__type = _UNSET
+        self.__group = _UNSET
+        # key => TransportableData
+        self.__fields: Optional[Dict[str, Optional[TransportableData]]] = None
+
+    @property  # Override
+    def type(self) -> str:
+        msg_type = self.__type
+        if msg_type is _UNSET:
+            msg_type = self.get_str(key='type', default='')
+            self.__type = msg_type
+        return msg_type
+
+    @property  # Override
+    def sn(self) -> int:
+        sn = self.__sn
+        if sn is _UNSET:
+            sn = self.get_int(key='sn', default=0)
+            self.__sn = sn
+        return sn
+
+    @property  # Override
+    def time(self) -> Optional[DateTime]:
+        when = self.__time
+        if when is _UNSET:
+            when = self.get_datetime(key='time')
+            self.__time = when
+        return when
+
+    @property  # Override
+    def group(self) -> Optional[ID]:
+        group = self.__group
+        if group is _UNSET:
+            group = ID.parse(identifier=self.get('group'))
+            self.__group = group
+        return group
+
+    @group.setter  # Override
+    def group(self, gid: ID):
+        self.set_string(key='group', value=gid)
+        self.__group = gid
+
+    #
+    #   Data Fields
+    #
+
+    def get_data(self, key: str) -> Optional[TransportableData]:
+        """ Get data field (decoded on first access) """
+        fields = self.__fields
+        if fields is None:
+            fields = {}
+            self.__fields = fields
+        elif key in fields:
+            return fields[key]
+        ted = TransportableData.parse(self.get(key))
+        fields[key] = ted
+        return ted
+
+    def set_data(self, key: str, value: Optional[TransportableData]):
+        """ Set data field (encoded into the map, object cached) """
+        if value is None:
+            self.pop(key, None)
+            return
+        self[key] = value.serialize()
+        fields = self.__fields
+        if fields is None:
+            fields = {}
+            self.__fields = fields
+        fields[key] = value
+
+    #
+    #   Mapping
+    #
+
+    # Override
+    def __setitem__(self, key: str, value: Any):
+        super().__setitem__(key, value)
+        self.__reset(key=key)
+
+    # Override
+    def __delitem__(self, key: str):
+        super().__delitem__(key)
+        self.__reset(key=key)
+
+    def __reset(self, key: str):
+        """ drop the cached value for the field """
+        if key == 'type':
+            self.__type = _UNSET
+        elif key == 'sn':
+            self.__sn = _UNSET
+        elif key == 'time':
+            self.__time = _UNSET
+        elif key == 'group':
+            self.__group = _UNSET
+        fields = self.__fields
+        if fields is not None:
+            fields.pop(key, None)
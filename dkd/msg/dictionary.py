@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+from collections.abc import Mapping
+from typing import Optional, Any, Iterator
+
+from mkm.types import DateTime
+from mkm.types import StrMap, MutableStrMap
+from mkm.types import Stringer
+from mkm.types import Mapper
+from mkm.types import Converter, Copier
+
+
+class Dictionary(Mapper):
+    """ Mapper with the inner map
+
+        A slotted map wrapper, it holds the original map directly,
+        so 'to_map()' returns the same map without copying.
+    """
+
+    __slots__ = ('__dictionary',)
+
+    def __init__(self, dictionary: Optional[StrMap] = None):
+        super().__init__()
+        if dictionary is None:
+            dictionary = {}
+        elif isinstance(dictionary, Mapper):
+            dictionary = dictionary.to_map()
+        self.__dictionary = dictionary
+
+    # Override
+    def get_str(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        value = self.__dictionary.get(key)
+        return Converter.get_str(value=value, default=default)
+
+    # Override
+    def get_bool(self, key: str, default: Optional[bool] = None) -> Optional[bool]:
+        value = self.__dictionary.get(key)
+        return Converter.get_bool(value=value, default=default)
+
+    # Override
+    def get_int(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        value = self.__dictionary.get(key)
+        return Converter.get_int(value=value, default=default)
+
+    # Override
+    def get_float(self, key: str, default: Optional[float] = None) -> Optional[float]:
+        value = self.__dictionary.get(key)
+        return Converter.get_float(value=value, default=default)
+
+    # Override
+    def get_datetime(self, key: str, default: Optional[DateTime] = None) -> Optional[DateTime]:
+        value = self.__dictionary.get(key)
+        return Converter.get_datetime(value=value, default=default)
+
+    # Override
+    def set_datetime(self, key: str, value: Optional[DateTime]):
+        if value is None:
+            self.pop(key, None)
+        else:
+            self[key] = value.timestamp
+
+    # Override
+    def set_string(self, key: str, value: Optional[Stringer]):
+        if value is None:
+            self.pop(key, None)
+        else:
+            self[key] = str(value)
+
+    # Override
+    def set_map(self, key: str, value: Optional[Mapper]):
+        if value is None:
+            self.pop(key, None)
+        else:
+            self[key] = value.to_map()
+
+    # Override
+    def to_map(self) -> MutableStrMap:
+        return self.__dictionary
+
+    # Override
+    def copy_map(self, deep_copy: bool = False) -> MutableStrMap:
+        if deep_copy:
+            return Copier.deep_copy_map(self.__dictionary)
+        else:
+            return Copier.copy_map(self.__dictionary)
+
+    #
+    #   Mapping
+    #
+
+    # Override
+    def __getitem__(self, key: str) -> Any:
+        return self.__dictionary[key]
+
+    # Override
+    def __setitem__(self, key: str, value: Any):
+        self.__dictionary[key] = value
+
+    # Override
+    def __delitem__(self, key: str):
+        del self.__dictionary[key]
+
+    # Override
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__dictionary)
+
+    # Override
+    def __len__(self) -> int:
+        return len(self.__dictionary)
+
+    # Override
+    def __contains__(self, key: Any) -> bool:
+        return key in self.__dictionary
+
+    # Override
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.__dictionary.get(key, default)
+
+    # Override
+    def __eq__(self, other: Any) -> bool:
+        if other is self:
+            return True
+        elif isinstance(other, Mapper):
+            other = other.to_map()
+        elif not isinstance(other, Mapping):
+            return False
+        return self.__dictionary == other
+
+    # Override
+    def __ne__(self, other: Any) -> bool:
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    # Override
+    def __str__(self) -> str:
+        return str(self.__dictionary)
+
+    # Override
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__}: {self.__dictionary}>'
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+from typing import Optional, Any
+
+from mkm.types import DateTime
+from mkm.types import StrMap
+from mkm.protocol import ID
+from mkm.protocol import ANYONE
+
+from ..protocol import Envelope, EnvelopeFactory
+
+from .dictionary import Dictionary
+
+
+# not parsed yet
+_UNSET = object()
+
+
+class MessageEnvelope(Dictionary, Envelope):
+    """ Compact envelope
+
+        The fields are parsed from the inner map on first access
+        and cached in slots; writing the map through the setters
+        (or by key) drops the cached value of that field.
+
+        data format: {
+            "sender"   : "moki@xxx",
+            "receiver" : "hulk@yyy",
+            "time"     : 123.45,
+            "group"    : "{GroupID}",  // optional
+            "type"     : i2s(1)        // optional
+        }
+    """
+
+    __slots__ = ('__sender', '__receiver', '__time', '__group', '__type')
+
+    def __init__(self, envelope: Optional[StrMap] = None,
+                 sender: Optional[ID] = None, receiver: Optional[ID] = None, time: Optional[DateTime] = None):
+        if envelope is None:
+            # create new envelope
+            assert sender is not None, 'envelope sender should not be empty'
+            if receiver is None:
+                receiver = ANYONE
+            if time is None:
+                time = DateTime.now()
+            envelope = {
+                'sender': str(sender),
+                'receiver': str(receiver),
+                'time': time.timestamp,
+            }
+            super().__init__(dictionary=envelope)
+            self.__sender = sender
+            self.__receiver = receiver
+            self.__time = time
+        else:
+            # parse fields lazily
+            super().__init__(dictionary=envelope)
+            self.__sender = _UNSET
+            self.__receiver = _UNSET
+            self.__time = _UNSET
+        self.__group = _UNSET
+        self.__type = _UNSET
+
+    @property  # Override
+    def sender(self) -> ID:
+        sender = self.__sender
+        if sender is _UNSET:
+            sender = ID.parse(identifier=self.get('sender'))
+            self.__sender = sender
+        return sender
+
+    @property  # Override
+    def receiver(self) -> ID:
+        receiver = self.__receiver
+        if receiver is _UNSET:
+            receiver = ID.parse(identifier=self.get('receiver'))
+            if receiver is None:
+                receiver = ANYONE
+            self.__receiver = receiver
+        return receiver
+
+    @property  # Override
+    def time(self) -> Optional[DateTime]:
+        when = self.__time
+        if when is _UNSET:
+            when = self.get_datetime(key='time')
+            self.__time = when
+        return when
+
+    @property  # Override
+    def group(self) -> Optional[ID]:
+        group = self.__group
+        if group is _UNSET:
+            group = ID.parse(identifier=self.get('group'))
+            self.__group = group
+        return group
+
+    @group.setter  # Override
+    def group(self, gid: ID):
+        self.set_string(key='group', value=gid)
+        self.__group = gid
+
+    @property  # Override
+    def type(self) -> Optional[str]:
+        msg_type = self.__type
+        if msg_type is _UNSET:
+            msg_type = self.get_str(key='type')
+            self.__type = msg_type
+        return msg_type
+
+    @type.setter  # Override
+    def type(self, msg_type: str):
+        if msg_type is None:
+            self.pop('type', None)
+        else:
+            self['type'] = msg_type
+        self.__type = msg_type
+
+    #
+    #   Mapping
+    #
+
+    # Override
+    def __setitem__(self, key: str, value: Any):
+        super().__setitem__(key, value)
+        self.__reset(key=key)
+
+    # Override
+    def __delitem__(self, key: str):
+        super().__delitem__(key)
+        self.__reset(key=key)
+
+    def __reset(self, key: str):
+        """ drop the cached value for the field """
+        if key == 'sender':
+            self.__sender = _UNSET
+        elif key == 'receiver':
+            self.__receiver = _UNSET
+        elif key == 'time':
+            self.__time = _UNSET
+        elif key == 'group':
+            self.__group = _UNSET
+        elif key == 'type':
+            self.__type = _UNSET
+
+
+class MessageEnvelopeFactory(EnvelopeFactory):
+    """ Factory for compact envelopes """
+
+    # Override
+    def create_envelope(self, sender: ID, receiver: ID, time: Optional[DateTime]) -> Envelope:
+        return MessageEnvelope(sender=sender, receiver=receiver, time=time)
+
+    # Override
+    def parse_envelope(self, envelope: StrMap) -> Optional[Envelope]:
+        # check 'sender'
+        if envelope.get('sender') is None:
+            # env.sender should not be empty
+            return None
+        return MessageEnvelope(envelope=envelope)
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+from typing import Optional, Any
+
+from mkm.types import StrMap
+from mkm.format import TransportableData
+
+from ..protocol import Envelope
+from ..protocol import ReliableMessage, ReliableMessageFactory
+
+from .secure import EncryptedMessage
+
+
+class NetworkMessage(EncryptedMessage, ReliableMessage):
+    """ Reliable message with lazy body
+
+        Only the envelope is needed for routing, the 'data', 'keys' and
+        'signature' fields will not be decoded before their properties
+        are accessed, and the inner map is never rewritten, so the
+        original map can be passed through untouched.
+
+        data format: {
+            //-- envelope
+            "sender"   : "moki@xxx",
+            "receiver" : "hulk@yyy",
+            "time"     : 123.45,
+            //-- content data and keys
+            "data"     : "...",
+            "keys"     : {
+                "ID1"    : "key1",
+                "digest" : "..."
+            },
+            //-- signature
+            "signature": "..."
+        }
+    """
+
+    __slots__ = ('__signature',)
+
+    def __init__(self, msg: StrMap, head: Optional[Envelope] = None):
+        super().__init__(msg=msg, head=head)
+        self.__signature = None
+
+    @property  # Override
+    def signature(self) -> TransportableData:
+        ted = self.__signature
+        if ted is None:
+            ted = TransportableData.parse(self.get('signature'))
+            self.__signature = ted
+        return ted
+
+    # Override
+    def preload(self, data: Optional[TransportableData], signature: Optional[TransportableData] = None):
+        """ Cache the decoded 'data' & 'signature', they must match the values in the map """
+        super().preload(data=data)
+        if signature is not None:
+            self.__signature = signature
+
+    #
+    #   Mapping
+    #
+
+    # Override
+    def __setitem__(self, key: str, value: Any):
+        super().__setitem__(key, value)
+        if key == 'signature':
+            self.__signature = None
+
+    # Override
+    def __delitem__(self, key: str):
+        super().__delitem__(key)
+        if key == 'signature':
+            self.__signature = None
+
+
+class NetworkMessageFactory(ReliableMessageFactory):
+    """ Reliable message factory
+
+        In routing mode (lazy), only the envelope fields are decoded
+        while parsing, the message body will be decoded on demand;
+        otherwise the body will be decoded and checked immediately.
+    """
+
+    def __init__(self, lazy: bool = True):
+        super().__init__()
+        self.__lazy = lazy
+
+    @property
+    def lazy(self) -> bool:
+        return self.__lazy
+
+    # Override
+    def parse_reliable_message(self, msg: StrMap) -> Optional[ReliableMessage]:
+        # check 'sender', 'data', 'signature'
+        if 'sender' not in msg or 'data' not in msg or 'signature' not in msg:
+            return None
+        # decode envelope fields for routing
+        head = Envelope.parse(envelope=msg)
+        if head is None or head.sender is None or head.receiver is None:
+            return None
+        # group & type are also needed by the station
+        _ = head.group
+        _ = head.type
+        rmsg = NetworkMessage(msg=msg, head=head)
+        if self.__lazy:
+            return rmsg
+        # decode message body
+        if rmsg.data is None or rmsg.signature is None:
+            return None
+        _ = rmsg.encrypted_keys
+        return rmsg
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+from typing import Optional, Any
+
+from mkm.types import StrMap
+from mkm.format import TransportableData
+
+from ..protocol import Envelope
+from ..protocol import SecureMessage
+from ..protocol import EncryptedKeys
+
+from .base import BaseMessage
+
+
+# not parsed yet
+_UNSET = object()
+
+
+class EncryptedMessage(BaseMessage, SecureMessage):
+    """ Secure message with lazy body
+
+        The 'data' and 'keys' fields stay in the inner map untouched,
+        they will be parsed only when the properties are first accessed.
+
+        data format: {
+            //-- envelope
+            "sender"   : "moki@xxx",
+            "receiver" : "hulk@yyy",
+            "time"     : 123.45,
+            //-- content data & keys
+            "data"     : "...",
+            "keys"     : {
+                "ID1"    : "key1",
+                "digest" : "..."
+            }
+        }
+    """
+
+    __slots__ = ('__data', '__keys', '__table')
+
+    def __init__(self, msg: StrMap, head: Optional[Envelope] = None):
+        super().__init__(msg=msg, head=head)
+        self.__data = None
+        self.__keys = _UNSET
+        self.__table = _UNSET
+
+    @property  # Override
+    def data(self) -> TransportableData:
+        ted = self.__data
+        if ted is None:
+            ted = TransportableData.parse(self.get('data'))
+            self.__data = ted
+        return ted
+
+    def preload(self, data: Optional[TransportableData]):
+        """ Cache the decoded 'data', it must match the value in the map """
+        if data is not None:
+            self.__data = data
+
+    @property  # Override
+    def encrypted_keys(self) -> Optional[StrMap]:
+        keys = self.__keys
+        if keys is _UNSET:
+            keys = self.get('keys')
+            self.__keys = keys
+        return keys
+
+    @property  # Override
+    def message_keys(self) -> Optional[EncryptedKeys]:
+        table = self.__table
+        if table is _UNSET:
+            keys = self.encrypted_keys
+            table = None if keys is None else EncryptedKeys(keys)
+            self.__table = table
+        return table
+
+    #
+    #   Mapping
+    #
+
+    # Override
+    def __setitem__(self, key: str, value: Any):
+        super().__setitem__(key, value)
+        self.__reset(key=key)
+
+    # Override
+    def __delitem__(self, key: str):
+        super().__delitem__(key)
+        self.__reset(key=key)
+
+    def __reset(self, key: str):
+        """ drop the cached value for the field """
+        if key == 'data':
+            self.__data = None
+        elif key == 'keys':
+            self.__keys = _UNSET
+            self.__table = _UNSET
@@ -36,6 +36,8 @@ from .instant import InstantMessage, InstantMessageFactory
 from .secure import SecureMessage, SecureMessageFactory
 from .reliable import ReliableMessage, ReliableMessageFactory
 
+from .keys import EncryptedKeys
+
 # from .content import ContentHelper
 # from .envelope import EnvelopeHelper
 # from .instant import InstantMessageHelper
@@ -55,6 +57,8 @@ __all__ = [
     'Message',
     'InstantMessage', 'SecureMessage', 'ReliableMessage',
 
+    'EncryptedKeys',
+
     #
     #   Factories
     #
@@ -29,8 +29,11 @@
 # ==============================================================================
 
 from abc import ABC, abstractmethod
+from operator import attrgetter
 from typing import Optional, Any, List
-from typing import Iterable
+from typing import Iterable, Iterator
+from typing import AsyncIterable, AsyncIterator
+from typing import Union
 
 from mkm.types import DateTime
 from mkm.types import StrMap, MutableStrMap
@@ -38,6 +41,8 @@ from mkm.types import Mapper
 from mkm.protocol import ID
 
 from .envelope import shared_message_extensions
+from .envelope import bind_factory_method
+from .envelope import aiter_parse, aiter_maps
 
 
 class Content(Mapper, ABC):
@@ -110,22 +115,40 @@ class Content(Mapper, ABC):
 
     @classmethod
     def convert(cls, array: Iterable):  # -> List[Content]:
-        contents = []
+        return list(cls.iter_convert(array=array))
+
+    @classmethod
+    def revert(cls, contents: Iterable) -> List[MutableStrMap]:
+        return list(cls.iter_revert(contents=contents))
+
+    @classmethod
+    def iter_convert(cls, array: Iterable):  # -> Iterator[Content]:
+        """ Parse contents one by one (lazily) """
+        helper = content_helper()
         for item in array:
-            msg = cls.parse(content=item)
+            msg = helper.parse_content(content=item)
             if msg is None:
                 # content error
                 continue
-            contents.append(msg)
-        return contents
+            yield msg
 
     @classmethod
-    def revert(cls, contents: Iterable) -> List[MutableStrMap]:
-        array = []
+    def iter_revert(cls, contents: Iterable) -> Iterator[MutableStrMap]:
+        """ Get content maps one by one (lazily) """
         for msg in contents:
             assert isinstance(msg, Content), f'content error: {msg}'
-            array.append(msg.to_map())
-        return array
+            yield msg.to_map()
+
+    @classmethod
+    def aiter_convert(cls, array: Union[Iterable, AsyncIterable]):  # -> AsyncIterator[Content]:
+        """ Parse contents one by one from sync/async iterable """
+        helper = content_helper()
+        return aiter_parse(array, parse=helper.parse_content)
+
+    @classmethod
+    def aiter_revert(cls, contents: Union[Iterable, AsyncIterable]) -> AsyncIterator[MutableStrMap]:
+        """ Get content maps one by one from sync/async iterable """
+        return aiter_maps(contents, cls=Content)
 
     #
     #   Factory method
@@ -136,6 +159,14 @@ class Content(Mapper, ABC):
         helper = content_helper()
         return helper.parse_content(content=content)
 
+    @classmethod
+    async def aparse(cls, content: Any):  # -> Optional[Content]:
+        helper = async_content_helper()
+        if helper is None:
+            # parse in current thread
+            return cls.parse(content=content)
+        return await helper.parse_content(content=content)
+
     @classmethod
     def get_factory(cls, msg_type: str):  # -> Optional[ContentFactory]:
         helper = content_helper()
@@ -193,6 +224,17 @@ class ContentHelper(ABC):
         )
 
 
+class AsyncContentHelper(ABC):
+    """ General Helper (asyncio) """
+
+    @abstractmethod
+    async def parse_content(self, content: Any) -> Optional[Content]:
+        """ Parse any object to content """
+        raise NotImplementedError(
+            f'Not implemented: {type(self).__module__}.{type(self).__name__}.parse_content()'
+        )
+
+
 class ContentExtension:
 
     @property
@@ -209,8 +251,23 @@ class ContentExtension:
             f'Not implemented: {type(self).__module__}.{type(self).__name__}.content_helper setter'
         )
 
+    @property
+    def async_content_helper(self) -> Optional[AsyncContentHelper]:
+        """ Get async content helper """
+        raise NotImplementedError(
+            f'Not implemented: {type(self).__module__}.{type(self).__name__}.async_content_helper getter'
+        )
+
+    @async_content_helper.setter
+    def async_content_helper(self, helper: AsyncContentHelper):
+        """ Set async content helper """
+        raise NotImplementedError(
+            f'Not implemented: {type(self).__module__}.{type(self).__name__}.async_content_helper setter'
+        )
+
 
 shared_message_extensions.content_helper: Optional[ContentHelper] = None
+shared_message_extensions.async_content_helper: Optional[AsyncContentHelper] = None
 
 
 def message_extensions() -> ContentExtension:
@@ -220,3 +277,11 @@ def message_extensions() -> ContentExtension:
 def content_helper() -> ContentHelper:
     ext = message_extensions()
     return ext.content_helper
+
+
+def async_content_helper() -> Optional[AsyncContentHelper]:
+    ext = message_extensions()
+    return ext.async_content_helper
+
+
+bind_factory_method(Content, 'parse', 'content_helper', attrgetter('parse_content'))
@@ -29,7 +29,11 @@
 # ==============================================================================
 
 from abc import ABC, abstractmethod
-from typing import Optional, Any
+from operator import attrgetter
+from typing import Optional, Any, Callable, List, Tuple, Dict
+from typing import Iterable, Iterator
+from typing import AsyncIterable, AsyncIterator
+from typing import Union
 
 from mkm.types import Singleton
 from mkm.types import DateTime
@@ -133,6 +137,18 @@ class Envelope(Mapper, ABC):
             f'Not implemented: {type(self).__module__}.{type(self).__name__}.type setter'
         )
 
+    #
+    #   Group Message
+    #
+
+    def split(self, members: Iterable[ID]):  # -> Iterator[Envelope]:
+        """ Split group envelope for members one by one (lazily), see 'split_messages()' """
+        return split_messages(self, members=members, parse=Envelope.parse)
+
+    def trim(self, member: ID):  # -> Optional[Envelope]:
+        """ Get envelope for the group member """
+        return next(self.split(members=[member]), None)
+
     #
     #   Factory methods
     #
@@ -147,6 +163,22 @@ class Envelope(Mapper, ABC):
         helper = envelope_helper()
         return helper.parse_envelope(envelope=envelope)
 
+    @classmethod
+    async def acreate(cls, sender: ID, receiver: ID, time: DateTime = None):  # -> Envelope:
+        helper = async_envelope_helper()
+        if helper is None:
+            # create in current thread
+            return cls.create(sender=sender, receiver=receiver, time=time)
+        return await helper.create_envelope(sender=sender, receiver=receiver, time=time)
+
+    @classmethod
+    async def aparse(cls, envelope: Any):  # -> Optional[Envelope]:
+        helper = async_envelope_helper()
+        if helper is None:
+            # parse in current thread
+            return cls.parse(envelope=envelope)
+        return await helper.parse_envelope(envelope=envelope)
+
     @classmethod
     def get_factory(cls):  # -> EnvelopeFactory:
         helper = envelope_helper()
@@ -158,12 +190,74 @@ class Envelope(Mapper, ABC):
         helper.set_envelope_factory(factory=factory)
 
 
+def split_maps(info: StrMap, group: ID, members: Iterable[ID]) -> Iterator[Dict[str, Any]]:
+    """ Shallow copy the message map for each member of the group """
+    group = str(group)
+    for member in members:
+        copy = dict(info)
+        copy['receiver'] = str(member)
+        copy['group'] = group
+        yield copy
+
+
+def split_messages(msg, members: Iterable[ID], parse: Callable[[Dict[str, Any]], Any], keys=None) -> Iterator:
+    """
+    Split group envelope/message for members one by one (lazily),
+    each one is a shallow copy with 'receiver' changed to the member,
+    and the group ID saved as 'group'; the other values are shared.
+
+    :param msg:     group envelope/message
+    :param members: group members
+    :param parse:   function to parse the copied map
+    :param keys:    EncryptedKeys to be trimmed to the member's key & digest
+    :return: envelopes/messages for members
+    """
+    group = msg.group
+    if group is None:
+        group = msg.receiver
+    for info in split_maps(msg.to_map(), group=group, members=members):
+        if keys is not None:
+            info['keys'] = keys.trim(receiver=info['receiver'])
+        item = parse(info)
+        if item is not None:
+            yield item
+
+
+async def aiter_items(array: Union[Iterable, AsyncIterable]) -> AsyncIterator:
+    """ Iterate sync/async iterable asynchronously """
+    if isinstance(array, AsyncIterable):
+        async for item in array:
+            yield item
+    else:
+        for item in array:
+            yield item
+
+
+async def aiter_parse(array: Union[Iterable, AsyncIterable], parse: Callable[[Any], Any]) -> AsyncIterator:
+    """ Parse items one by one from sync/async iterable, skip the failed ones """
+    async for item in aiter_items(array):
+        obj = parse(item)
+        if obj is not None:
+            yield obj
+
+
+async def aiter_maps(array: Union[Iterable, AsyncIterable], cls: type) -> AsyncIterator[Dict[str, Any]]:
+    """ Get maps of the objects (instances of cls) one by one from sync/async iterable """
+    async for obj in aiter_items(array):
+        assert isinstance(obj, cls), f'{cls.__name__} error: {obj}'
+        yield obj.to_map()
+
+
 def envelope_helper():
     helper = shared_message_extensions.envelope_helper
     assert isinstance(helper, EnvelopeHelper), f'envelope helper error: {helper}'
     return helper
 
 
+def async_envelope_helper():  # -> Optional[AsyncEnvelopeHelper]:
+    return shared_message_extensions.async_envelope_helper
+
+
 class EnvelopeFactory(ABC):
     """ Envelope Factory """
 
@@ -231,6 +325,24 @@ class EnvelopeHelper(ABC):
         )
 
 
+class AsyncEnvelopeHelper(ABC):
+    """ General Helper (asyncio) """
+
+    @abstractmethod
+    async def create_envelope(self, sender: ID, receiver: ID, time: Optional[DateTime]) -> Envelope:
+        """ Create envelope with sender, receiver and time """
+        raise NotImplementedError(
+            f'Not implemented: {type(self).__module__}.{type(self).__name__}.create_envelope()'
+        )
+
+    @abstractmethod
+    async def parse_envelope(self, envelope: Any) -> Optional[Envelope]:
+        """ Parse any object to envelope """
+        raise NotImplementedError(
+            f'Not implemented: {type(self).__module__}.{type(self).__name__}.parse_envelope()'
+        )
+
+
 @Singleton
 class MessageExtensions:
 
@@ -244,10 +356,88 @@ class MessageExtensions:
         """ Set envelope helper """
         _EnvExt.envelope_helper = helper
 
+    @property
+    def async_envelope_helper(self) -> Optional[AsyncEnvelopeHelper]:
+        """ Get async envelope helper """
+        return _EnvExt.async_envelope_helper
+
+    @async_envelope_helper.setter
+    def async_envelope_helper(self, helper: Optional[AsyncEnvelopeHelper]):
+        """ Set async envelope helper """
+        _EnvExt.async_envelope_helper = helper
+
+    #
+    #   Frozen Mode
+    #
+
+    @property
+    def frozen(self) -> bool:
+        return _EnvExt.frozen
+
+    def freeze(self):
+        """
+        Bind the registered helpers into the factory methods directly,
+        call it after all helpers are set at startup;
+        setting a helper in frozen mode will rebind the methods.
+        """
+        _EnvExt.frozen = True
+        for binding in _EnvExt.bindings:
+            _bind(self, binding)
+
+    def reset(self):
+        """ Restore the factory methods to get helpers on each call """
+        _EnvExt.frozen = False
+        for clazz, name, original, _, _ in _EnvExt.bindings:
+            setattr(clazz, name, original)
+
+    def __setattr__(self, key: str, value: Any):
+        super().__setattr__(key, value)
+        if _EnvExt.frozen and key.endswith('_helper'):
+            self.freeze()
+
 
 class _EnvExt:
     envelope_helper: Optional[EnvelopeHelper] = None
+    async_envelope_helper: Optional[AsyncEnvelopeHelper] = None
+    # frozen mode
+    frozen: bool = False
+    bindings: List[Tuple[type, str, Any, str, Callable]] = []
+
+
+def _bind(ext, binding: Tuple[type, str, Any, str, Callable]):
+    clazz, name, original, helper_name, bind = binding
+    helper = getattr(ext, helper_name, None)
+    if helper is None:
+        setattr(clazz, name, original)
+    else:
+        setattr(clazz, name, staticmethod(bind(helper)))
+
+
+def bind_factory_method(clazz: type, name: str, helper_name: str, bind: Callable):
+    """
+    Register a factory method for the frozen mode
+
+    :param clazz:       protocol class
+    :param name:        name of the factory method (classmethod)
+    :param helper_name: name of the helper in message extensions
+    :param bind:        function to get the direct method from the helper
+    """
+    binding = (clazz, name, clazz.__dict__[name], helper_name, bind)
+    _EnvExt.bindings.append(binding)
+    if _EnvExt.frozen:
+        _bind(shared_message_extensions, binding)
+
+
+def _frozen_create_envelope(helper: EnvelopeHelper) -> Callable:
+    create_envelope = helper.create_envelope
+
+    def create(sender: ID, receiver: ID, time: DateTime = None) -> Envelope:
+        return create_envelope(sender=sender, receiver=receiver, time=time)
+    return create
 
 
 # global
 shared_message_extensions = MessageExtensions()
+
+bind_factory_method(Envelope, 'create', 'envelope_helper', _frozen_create_envelope)
+bind_factory_method(Envelope, 'parse', 'envelope_helper', attrgetter('parse_envelope'))
@@ -29,16 +29,23 @@
 # ==============================================================================
 
 from abc import ABC, abstractmethod
+from operator import attrgetter
 from typing import Optional, Any, List
-from typing import Iterable
+from typing import Iterable, Iterator
+from typing import AsyncIterable, AsyncIterator
+from typing import Union
 
 from mkm.types import DateTime
 from mkm.types import StrMap, MutableStrMap
+from mkm.protocol import ID
 
 from .content import Content
 from .envelope import Envelope
 from .message import Message
 from .envelope import shared_message_extensions
+from .envelope import bind_factory_method
+from .envelope import aiter_parse, aiter_maps
+from .envelope import split_messages
 
 
 class InstantMessage(Message, ABC):
@@ -83,22 +90,52 @@ class InstantMessage(Message, ABC):
 
     @classmethod
     def convert(cls, array: Iterable):  # -> List[InstantMessage]:
-        messages = []
+        return list(cls.iter_convert(array=array))
+
+    @classmethod
+    def revert(cls, messages: Iterable) -> List[MutableStrMap]:
+        return list(cls.iter_revert(messages=messages))
+
+    @classmethod
+    def iter_convert(cls, array: Iterable):  # -> Iterator[InstantMessage]:
+        """ Parse messages one by one (lazily) """
+        helper = instant_helper()
         for item in array:
-            msg = cls.parse(msg=item)
+            msg = helper.parse_instant_message(msg=item)
             if msg is None:
                 # message error
                 continue
-            messages.append(msg)
-        return messages
+            yield msg
 
     @classmethod
-    def revert(cls, messages: Iterable) -> List[MutableStrMap]:
-        array = []
+    def iter_revert(cls, messages: Iterable) -> Iterator[MutableStrMap]:
+        """ Get message maps one by one (lazily) """
         for msg in messages:
             assert isinstance(msg, InstantMessage), f'message error: {msg}'
-            array.append(msg.to_map())
-        return array
+            yield msg.to_map()
+
+    @classmethod
+    def aiter_convert(cls, array: Union[Iterable, AsyncIterable]):  # -> AsyncIterator[InstantMessage]:
+        """ Parse messages one by one from sync/async iterable """
+        helper = instant_helper()
+        return aiter_parse(array, parse=helper.parse_instant_message)
+
+    @classmethod
+    def aiter_revert(cls, messages: Union[Iterable, AsyncIterable]) -> AsyncIterator[MutableStrMap]:
+        """ Get message maps one by one from sync/async iterable """
+        return aiter_maps(messages, cls=InstantMessage)
+
+    #
+    #   Group Message
+    #
+
+    def split(self, members: Iterable[ID]):  # -> Iterator[InstantMessage]:
+        """ Split group message for members one by one (lazily), see 'split_messages()' """
+        return split_messages(self, members=members, parse=InstantMessage.parse)
+
+    def trim(self, member: ID):  # -> Optional[InstantMessage]:
+        """ Get message for the group member """
+        return next(self.split(members=[member]), None)
 
     #
     #   Factory methods
@@ -114,6 +151,22 @@ class InstantMessage(Message, ABC):
         helper = instant_helper()
         return helper.parse_instant_message(msg=msg)
 
+    @classmethod
+    async def acreate(cls, head: Envelope, body: Content):  # -> InstantMessage:
+        helper = async_instant_helper()
+        if helper is None:
+            # create in current thread
+            return cls.create(head=head, body=body)
+        return await helper.create_instant_message(head=head, body=body)
+
+    @classmethod
+    async def aparse(cls, msg: Any):  # -> Optional[InstantMessage]:
+        helper = async_instant_helper()
+        if helper is None:
+            # parse in current thread
+            return cls.parse(msg=msg)
+        return await helper.parse_instant_message(msg=msg)
+
     @classmethod
     def generate_serial_number(cls, msg_type: Optional[str] = None, now: Optional[DateTime] = None) -> int:
         helper = instant_helper()
@@ -216,6 +269,24 @@ class InstantMessageHelper(ABC):
         )
 
 
+class AsyncInstantMessageHelper(ABC):
+    """ General Helper (asyncio) """
+
+    @abstractmethod
+    async def create_instant_message(self, head: Envelope, body: Content) -> InstantMessage:
+        """ Create instant message """
+        raise NotImplementedError(
+            f'Not implemented: {type(self).__module__}.{type(self).__name__}.create_instant_message()'
+        )
+
+    @abstractmethod
+    async def parse_instant_message(self, msg: Any) -> Optional[InstantMessage]:
+        """ Parse any object to instant message """
+        raise NotImplementedError(
+            f'Not implemented: {type(self).__module__}.{type(self).__name__}.parse_instant_message()'
+        )
+
+
 class InstantMessageExtension:
 
     @property
@@ -232,8 +303,23 @@ class InstantMessageExtension:
             f'Not implemented: {type(self).__module__}.{type(self).__name__}.instant_helper setter'
         )
 
+    @property
+    def async_instant_helper(self) -> Optional[AsyncInstantMessageHelper]:
+        """ Get async instant message helper """
+        raise NotImplementedError(
+            f'Not implemented: {type(self).__module__}.{type(self).__name__}.async_instant_helper getter'
+        )
+
+    @async_instant_helper.setter
+    def async_instant_helper(self, helper: AsyncInstantMessageHelper):
+        """ Set async instant message helper """
+        raise NotImplementedError(
+            f'Not implemented: {type(self).__module__}.{type(self).__name__}.async_instant_helper setter'
+        )
+
 
 shared_message_extensions.instant_helper: Optional[InstantMessageHelper] = None
+shared_message_extensions.async_instant_helper: Optional[AsyncInstantMessageHelper] = None
 
 
 def message_extensions() -> InstantMessageExtension:
@@ -243,3 +329,21 @@ def message_extensions() -> InstantMessageExtension:
 def instant_helper() -> InstantMessageHelper:
     ext = message_extensions()
     return ext.instant_helper
+
+
+def async_instant_helper() -> Optional[AsyncInstantMessageHelper]:
+    ext = message_extensions()
+    return ext.async_instant_helper
+
+
+def _frozen_generate_serial_number(helper: InstantMessageHelper):
+    generate = helper.generate_serial_number
+
+    def generate_serial_number(msg_type: Optional[str] = None, now: Optional[DateTime] = None) -> int:
+        return generate(msg_type, now)
+    return generate_serial_number
+
+
+bind_factory_method(InstantMessage, 'create', 'instant_helper', attrgetter('create_instant_message'))
+bind_factory_method(InstantMessage, 'parse', 'instant_helper', attrgetter('parse_instant_message'))
+bind_factory_method(InstantMessage, 'generate_serial_number', 'instant_helper', _frozen_generate_serial_number)
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+from typing import Optional, Any, Iterator, Dict
+
+from mkm.types import StrMap
+from mkm.protocol import ID
+
+
+class EncryptedKeys:
+    """ Encrypted keys for receivers
+
+        A read-only view of the 'keys' map in secure message,
+        it holds the original map directly without copying.
+
+        data format: {
+            "ID1"    : "key1",  // base64_encode(asymmetric_encrypt(password))
+            "ID2"    : "key2",
+            "digest" : "..."    // hash(password.data)
+        }
+    """
+
+    __slots__ = ('__keys',)
+
+    DIGEST = 'digest'
+
+    def __init__(self, keys: StrMap):
+        super().__init__()
+        self.__keys = keys
+
+    def to_map(self) -> StrMap:
+        return self.__keys
+
+    @property
+    def digest(self) -> Optional[Any]:
+        """ hash of the symmetric key """
+        return self.__keys.get(self.DIGEST)
+
+    def get_key(self, receiver: ID) -> Optional[Any]:
+        """ Get encrypted key for the receiver """
+        name = str(receiver)
+        if name == self.DIGEST:
+            return None
+        return self.__keys.get(name)
+
+    @property
+    def receivers(self) -> Iterator[str]:
+        """ ID strings of the receivers """
+        for name in self.__keys:
+            if name != self.DIGEST:
+                yield name
+
+    def trim(self, receiver: ID) -> Dict[str, Any]:
+        """ Get a new keys map with the digest and key for this receiver only """
+        keys = self.__keys
+        info = {}
+        name = str(receiver)
+        if name != self.DIGEST:
+            key = keys.get(name)
+            if key is not None:
+                info[name] = key
+        digest = keys.get(self.DIGEST)
+        if digest is not None:
+            info[self.DIGEST] = digest
+        return info
+
+    def __contains__(self, receiver: ID) -> bool:
+        name = str(receiver)
+        return name != self.DIGEST and name in self.__keys
+
+    def __len__(self) -> int:
+        """ count of receivers """
+        count = len(self.__keys)
+        if self.DIGEST in self.__keys:
+            count -= 1
+        return count
+
+    def __str__(self) -> str:
+        return str(self.__keys)
+
+    def __repr__(self) -> str:
+        return '<%s: %s>' % (self.__class__.__name__, self.__keys)
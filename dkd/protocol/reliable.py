@@ -29,14 +29,22 @@
 # ==============================================================================
 
 from abc import ABC, abstractmethod
-from typing import Optional, Any, List
-from typing import Iterable
+from operator import attrgetter
+from concurrent.futures import Executor
+from functools import partial
+from typing import Optional, Union, Any, Callable, List
+from typing import Iterable, Iterator
+from typing import AsyncIterable, AsyncIterator
 
 from mkm.types import StrMap, MutableStrMap
 from mkm.format import TransportableData
+from mkm.protocol import ID
 
 from .secure import SecureMessage
 from .envelope import shared_message_extensions
+from .envelope import bind_factory_method
+from .envelope import aiter_parse, aiter_maps
+from .envelope import split_messages
 
 
 class ReliableMessage(SecureMessage, ABC):
@@ -75,23 +83,63 @@ class ReliableMessage(SecureMessage, ABC):
     #
 
     @classmethod
-    def convert(cls, array: Iterable):  # -> List[ReliableMessage]:
+    def convert(cls, array: Iterable, executor: Optional[Executor] = None):  # -> List[ReliableMessage]:
+        helper = reliable_helper()
+        results = helper.parse_reliable_messages(messages=array, executor=executor)
         messages = []
-        for item in array:
-            msg = cls.parse(msg=item)
+        for msg in results:
             if msg is None:
                 # message error
                 continue
+            elif isinstance(msg, Exception):
+                raise msg
             messages.append(msg)
         return messages
 
     @classmethod
     def revert(cls, messages: Iterable) -> List[MutableStrMap]:
-        array = []
+        return list(cls.iter_revert(messages=messages))
+
+    @classmethod
+    def iter_convert(cls, array: Iterable):  # -> Iterator[ReliableMessage]:
+        """ Parse messages one by one (lazily) """
+        helper = reliable_helper()
+        for item in array:
+            msg = helper.parse_reliable_message(msg=item)
+            if msg is None:
+                # message error
+                continue
+            yield msg
+
+    @classmethod
+    def iter_revert(cls, messages: Iterable) -> Iterator[MutableStrMap]:
+        """ Get message maps one by one (lazily) """
         for msg in messages:
             assert isinstance(msg, ReliableMessage), f'message error: {msg}'
-            array.append(msg.to_map())
-        return array
+            yield msg.to_map()
+
+    @classmethod
+    def aiter_convert(cls, array: Union[Iterable, AsyncIterable]):  # -> AsyncIterator[ReliableMessage]:
+        """ Parse messages one by one from sync/async iterable """
+        helper = reliable_helper()
+        return aiter_parse(array, parse=helper.parse_reliable_message)
+
+    @classmethod
+    def aiter_revert(cls, messages: Union[Iterable, AsyncIterable]) -> AsyncIterator[MutableStrMap]:
+        """ Get message maps one by one from sync/async iterable """
+        return aiter_maps(messages, cls=ReliableMessage)
+
+    #
+    #   Group Message
+    #
+
+    def split(self, members: Iterable[ID]):  # -> Iterator[ReliableMessage]:
+        """ Split group message for members one by one (lazily), with 'keys' trimmed, see 'split_messages()' """
+        return split_messages(self, members=members, parse=ReliableMessage.parse, keys=self.message_keys)
+
+    def trim(self, member: ID):  # -> Optional[ReliableMessage]:
+        """ Get message for the group member """
+        return next(self.split(members=[member]), None)
 
     #
     #   Factory methods
@@ -102,6 +150,14 @@ class ReliableMessage(SecureMessage, ABC):
         helper = reliable_helper()
         return helper.parse_reliable_message(msg=msg)
 
+    @classmethod
+    async def aparse(cls, msg: Any):  # -> Optional[ReliableMessage]:
+        helper = async_reliable_helper()
+        if helper is None:
+            # parse in current thread
+            return cls.parse(msg=msg)
+        return await helper.parse_reliable_message(msg=msg)
+
     @classmethod
     def get_factory(cls):  # -> Optional[ReliableMessageFactory]:
         helper = reliable_helper()
@@ -158,6 +214,51 @@ class ReliableMessageHelper(ABC):
             f'Not implemented: {type(self).__module__}.{type(self).__name__}.parse_reliable_message()'
         )
 
+    def parse_reliable_messages(self, messages: Iterable,
+                                executor: Optional[Executor] = None) -> List[Union[ReliableMessage, Exception, None]]:
+        """
+        Parse a batch of objects to reliable messages
+
+            each item is parsed by 'self.parse_reliable_message()',
+            which is resolved only once for the whole batch,
+            and the items can be parsed in a thread/process pool;
+            when using a process pool, the helper must be picklable.
+
+        :param messages: message infos
+        :param executor: thread/process pool (optional)
+        :return: results in the same order, each item is a message,
+                 None (message error) or the exception raised by parsing
+        """
+        task = partial(_parse_reliable_message, self.parse_reliable_message)
+        if executor is None:
+            return [task(item) for item in messages]
+        else:
+            return list(executor.map(task, messages))
+
+
+def _parse_reliable_message(parse: Callable[[Any], Optional[ReliableMessage]],
+                            msg: Any) -> Union[ReliableMessage, Exception, None]:
+    """ Parse one item for batch, return the error instead of raising it """
+    try:
+        if msg is None:
+            return None
+        elif isinstance(msg, ReliableMessage):
+            return msg
+        return parse(msg)
+    except Exception as error:
+        return error
+
+
+class AsyncReliableMessageHelper(ABC):
+    """ General Helper (asyncio) """
+
+    @abstractmethod
+    async def parse_reliable_message(self, msg: Any) -> Optional[ReliableMessage]:
+        """ Parse any object to reliable message """
+        raise NotImplementedError(
+            f'Not implemented: {type(self).__module__}.{type(self).__name__}.parse_reliable_message()'
+        )
+
 
 class ReliableMessageExtension:
 
@@ -175,8 +276,23 @@ class ReliableMessageExtension:
             f'Not implemented: {type(self).__module__}.{type(self).__name__}.reliable_helper setter'
         )
 
+    @property
+    def async_reliable_helper(self) -> Optional[AsyncReliableMessageHelper]:
+        """ Get async reliable message helper """
+        raise NotImplementedError(
+            f'Not implemented: {type(self).__module__}.{type(self).__name__}.async_reliable_helper getter'
+        )
+
+    @async_reliable_helper.setter
+    def async_reliable_helper(self, helper: AsyncReliableMessageHelper):
+        """ Set async reliable message helper """
+        raise NotImplementedError(
+            f'Not implemented: {type(self).__module__}.{type(self).__name__}.async_reliable_helper setter'
+        )
+
 
 shared_message_extensions.reliable_helper: Optional[ReliableMessageHelper] = None
+shared_message_extensions.async_reliable_helper: Optional[AsyncReliableMessageHelper] = None
 
 
 def message_extensions() -> ReliableMessageExtension:
@@ -186,3 +302,11 @@ def message_extensions() -> ReliableMessageExtension:
 def reliable_helper() -> ReliableMessageHelper:
     ext = message_extensions()
     return ext.reliable_helper
+
+
+def async_reliable_helper() -> Optional[AsyncReliableMessageHelper]:
+    ext = message_extensions()
+    return ext.async_reliable_helper
+
+
+bind_factory_method(ReliableMessage, 'parse', 'reliable_helper', attrgetter('parse_reliable_message'))
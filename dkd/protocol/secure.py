@@ -29,13 +29,19 @@
 # ==============================================================================
 
 from abc import ABC, abstractmethod
+from operator import attrgetter
 from typing import Optional, Any
+from typing import Iterable
 
 from mkm.types import StrMap
 from mkm.format import TransportableData
+from mkm.protocol import ID
 
 from .message import Message
+from .keys import EncryptedKeys
 from .envelope import shared_message_extensions
+from .envelope import bind_factory_method
+from .envelope import split_messages
 
 
 class SecureMessage(Message, ABC):
@@ -74,6 +80,25 @@ class SecureMessage(Message, ABC):
             f'Not implemented: {type(self).__module__}.{type(self).__name__}.encrypted_keys getter'
         )
 
+    @property
+    def message_keys(self) -> Optional[EncryptedKeys]:
+        """ encrypted message keys (indexed by receivers) """
+        keys = self.encrypted_keys
+        if keys is not None:
+            return EncryptedKeys(keys)
+
+    #
+    #   Group Message
+    #
+
+    def split(self, members: Iterable[ID]):  # -> Iterator[SecureMessage]:
+        """ Split group message for members one by one (lazily), with 'keys' trimmed, see 'split_messages()' """
+        return split_messages(self, members=members, parse=SecureMessage.parse, keys=self.message_keys)
+
+    def trim(self, member: ID):  # -> Optional[SecureMessage]:
+        """ Get message for the group member """
+        return next(self.split(members=[member]), None)
+
     #
     #   Factory method
     #
@@ -83,6 +108,14 @@ class SecureMessage(Message, ABC):
         helper = secure_helper()
         return helper.parse_secure_message(msg=msg)
 
+    @classmethod
+    async def aparse(cls, msg: Any):  # -> Optional[SecureMessage]:
+        helper = async_secure_helper()
+        if helper is None:
+            # parse in current thread
+            return cls.parse(msg=msg)
+        return await helper.parse_secure_message(msg=msg)
+
     @classmethod
     def get_factory(cls):  # -> Optional[SecureMessageFactory]:
         helper = secure_helper()
@@ -140,6 +173,17 @@ class SecureMessageHelper(ABC):
         )
 
 
+class AsyncSecureMessageHelper(ABC):
+    """ General Helper (asyncio) """
+
+    @abstractmethod
+    async def parse_secure_message(self, msg: Any) -> Optional[SecureMessage]:
+        """ Parse any object to secure message """
+        raise NotImplementedError(
+            f'Not implemented: {type(self).__module__}.{type(self).__name__}.parse_secure_message()'
+        )
+
+
 class SecureMessageExtension:
 
     @property
@@ -156,8 +200,23 @@ class SecureMessageExtension:
             f'Not implemented: {type(self).__module__}.{type(self).__name__}.secure_helper setter'
         )
 
+    @property
+    def async_secure_helper(self) -> Optional[AsyncSecureMessageHelper]:
+        """ Get async secure message helper """
+        raise NotImplementedError(
+            f'Not implemented: {type(self).__module__}.{type(self).__name__}.async_secure_helper getter'
+        )
+
+    @async_secure_helper.setter
+    def async_secure_helper(self, helper: AsyncSecureMessageHelper):
+        """ Set async secure message helper """
+        raise NotImplementedError(
+            f'Not implemented: {type(self).__module__}.{type(self).__name__}.async_secure_helper setter'
+        )
+
 
 shared_message_extensions.secure_helper: Optional[SecureMessageHelper] = None
+shared_message_extensions.async_secure_helper: Optional[AsyncSecureMessageHelper] = None
 
 
 def message_extensions() -> SecureMessageExtension:
@@ -167,3 +226,11 @@ def message_extensions() -> SecureMessageExtension:
 def secure_helper():
     ext = message_extensions()
     return ext.secure_helper
+
+
+def async_secure_helper() -> Optional[AsyncSecureMessageHelper]:
+    ext = message_extensions()
+    return ext.async_secure_helper
+
+
+bind_factory_method(SecureMessage, 'parse', 'secure_helper', attrgetter('parse_secure_message'))
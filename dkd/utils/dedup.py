@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Optional, Any, Callable, Iterable, Iterator, List, Dict
+
+from mkm.types import Mapper
+from mkm.format import TransportableData
+
+from ..protocol import ReliableMessage
+
+
+def message_key(msg: Any) -> Optional[bytes]:
+    """
+    Get (sender, sn) or signature from message map
+
+    'sn' is a content field, it's taken from the top level (content with
+    'sender'), or from the 'content' of an instant message; a reliable
+    message has encrypted content, so only the signature path applies to it.
+    """
+    if isinstance(msg, Mapper):
+        msg = msg.to_map()
+    if not isinstance(msg, Mapping):
+        return None
+    sn = msg.get('sn')
+    if sn is None:
+        content = msg.get('content')
+        if isinstance(content, Mapping):
+            sn = content.get('sn')
+    if sn is not None:
+        sender = msg.get('sender')
+        if sender is not None:
+            return ('%s:%s' % (sender, sn)).encode('utf-8')
+    signature = msg.get('signature')
+    if isinstance(signature, str):
+        return signature.encode('utf-8')
+    elif isinstance(signature, TransportableData):
+        return signature.to_bytes()
+
+
+class BloomFilter:
+    """ Bloom filter with fixed capacity """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        super().__init__()
+        size = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.__size = max(size, 8)
+        self.__hashes = max(1, round(self.__size / capacity * math.log(2)))
+        self.__bits = bytearray((self.__size + 7) // 8)
+
+    def positions(self, key: bytes) -> List[int]:
+        """ bit positions for the key """
+        count = self.__hashes
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        size = self.__size
+        return [(h1 + i * h2) % size for i in range(count)]
+
+    def contains(self, positions: List[int]) -> bool:
+        bits = self.__bits
+        for pos in positions:
+            if bits[pos >> 3] & (1 << (pos & 7)) == 0:
+                return False
+        return True
+
+    def add(self, positions: List[int]):
+        bits = self.__bits
+        for pos in positions:
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+
+class MessageDeduplicator:
+    """ Duplicate message detector
+
+        Messages are keyed by (sender, sn) or signature (reliable messages
+        always use the signature), checked before parsing with a rotating
+        bloom filter (several generations, each for a part of the time
+        window) and an exact LRU:
+
+            1. not in bloom filter => new message;
+            2. in LRU => duplicated;
+            3. only in bloom filter:
+               a) the LRU covers the whole window => false positive, new;
+               b) the LRU has evicted keys seen within the window =>
+                  probably duplicated (or false positive); it's dropped
+                  only if 'confirm(msg)' (e.g. a lookup in storage) says
+                  so, or 'trust_bloom' is True; otherwise taken as new.
+    """
+
+    def __init__(self, window: float = 3600, capacity: int = 1000000, lru_size: int = 65536,
+                 generations: int = 4, error_rate: float = 0.001, trust_bloom: bool = False,
+                 confirm: Optional[Callable[[Any], bool]] = None,
+                 key: Callable[[Any], Optional[bytes]] = message_key,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Create deduplicator
+
+        :param window:      seconds to remember messages
+        :param capacity:    messages expected in a window
+        :param lru_size:    max size of the exact LRU
+        :param generations: bloom filters for rotating
+        :param error_rate:  false positive rate of bloom filter
+        :param trust_bloom: drop the probable duplicates without confirming
+        :param confirm:     function to check a probable duplicate (e.g. in storage)
+        :param key:         function to get key from message map
+        :param clock:       time function
+        """
+        super().__init__()
+        self.__window = window
+        self.__span = window / generations
+        self.__capacity = max(1, capacity // generations)
+        self.__error_rate = error_rate
+        self.__generations = generations
+        self.__lru_size = lru_size
+        self.__trust_bloom = trust_bloom
+        self.__confirm = confirm
+        self.__key = key
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__filters: List[BloomFilter] = [self.__new_filter()]
+        self.__rotated = clock()
+        # key => time
+        self.__lru: OrderedDict = OrderedDict()
+        # time of the last key evicted from LRU
+        self.__evicted: Optional[float] = None
+        self.__stats: Dict[str, int] = {'new': 0, 'duplicated': 0, 'probable': 0, 'unknown': 0}
+
+    def __new_filter(self) -> BloomFilter:
+        return BloomFilter(capacity=self.__capacity, error_rate=self.__error_rate)
+
+    def __rotate(self, now: float):
+        passed = int((now - self.__rotated) // self.__span)
+        if passed <= 0:
+            return
+        filters = self.__filters
+        for _ in range(min(passed, self.__generations)):
+            filters.insert(0, self.__new_filter())
+        del filters[self.__generations:]
+        self.__rotated += passed * self.__span
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return dict(self.__stats)
+
+    def is_duplicated(self, msg: Any) -> bool:
+        """ Check message map and remember it """
+        key = self.__key(msg)
+        if key is None:
+            # cannot identify it
+            self.__stats['unknown'] += 1
+            return False
+        now = self.__clock()
+        with self.__lock:
+            duplicated = self.__check(key=key, now=now)
+        if duplicated is not None:
+            return duplicated
+        # probable duplicate, confirm it outside the lock
+        if self.__trust_bloom:
+            return True
+        confirm = self.__confirm
+        if confirm is not None and confirm(msg):
+            return True
+        with self.__lock:
+            self.__remember(key=key, now=now, positions=self.__filters[0].positions(key))
+        return False
+
+    def __check(self, key: bytes, now: float) -> Optional[bool]:
+        """ True for duplicated, False for new (remembered), None for probable """
+        self.__rotate(now)
+        filters = self.__filters
+        positions = filters[0].positions(key)
+        seen = False
+        for bloom in filters:
+            if bloom.contains(positions):
+                seen = True
+                break
+        if seen:
+            lru = self.__lru
+            last = lru.get(key)
+            if last is not None and now - last < self.__window:
+                lru.move_to_end(key)
+                self.__stats['duplicated'] += 1
+                return True
+            evicted = self.__evicted
+            if last is None and evicted is not None and now - evicted < self.__window:
+                # beyond the LRU, only the bloom filter remembers it
+                self.__stats['probable'] += 1
+                return None
+        # new message, or false positive of the bloom filter
+        self.__remember(key=key, now=now, positions=positions)
+        return False
+
+    def __remember(self, key: bytes, now: float, positions: List[int]):
+        self.__stats['new'] += 1
+        self.__filters[0].add(positions)
+        lru = self.__lru
+        lru[key] = now
+        lru.move_to_end(key)
+        if len(lru) > self.__lru_size:
+            _, self.__evicted = lru.popitem(last=False)
+
+    #
+    #   Before parsing
+    #
+
+    def filter(self, array: Iterable) -> Iterator[Any]:
+        """ Skip duplicated message maps """
+        for msg in array:
+            if not self.is_duplicated(msg):
+                yield msg
+
+    def parse(self, msg: Any) -> Optional[ReliableMessage]:
+        """ Parse message map if it's not duplicated """
+        if self.is_duplicated(msg):
+            return None
+        return ReliableMessage.parse(msg=msg)
+
+    def convert(self, array: Iterable) -> List[ReliableMessage]:
+        """ Parse message maps, skip the duplicated ones """
+        return ReliableMessage.convert(self.filter(array))
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+from bisect import bisect_right
+from typing import Optional, Union, Any, Iterable, List, Dict, Tuple, FrozenSet
+
+from mkm.types import StrMap
+from mkm.types import Stringer
+from mkm.types import Mapper
+from mkm.types import Converter
+
+from ..ext.content import normalize_type
+
+
+# (order, target, senders, receivers, groups, types, since, until)
+_Rule = Tuple[int, Any, Optional[FrozenSet[str]], Optional[FrozenSet[str]], Optional[FrozenSet[str]],
+              Optional[FrozenSet[str]], Optional[float], Optional[float]]
+
+_NEG_INF = float('-inf')
+
+
+def _values(value: Any, normalize=str) -> Optional[FrozenSet[str]]:
+    """ one value or iterable values => set of strings """
+    if value is None:
+        return None
+    elif isinstance(value, (str, int, Stringer)):
+        # ID is a Stringer, not a str
+        return frozenset([normalize(value)])
+    return frozenset(normalize(item) for item in value)
+
+
+def _id_value(value: Any) -> Optional[str]:
+    """ ID string from raw map, or None """
+    if isinstance(value, str):
+        return value
+    elif isinstance(value, Stringer):
+        return str(value)
+
+
+def _time_value(value: Any) -> Optional[float]:
+    """ timestamp from raw map, or None """
+    try:
+        return Converter.get_float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+class EnvelopeFilter:
+    """ Filter/Routing index on envelope fields
+
+        Rules are compiled into hash tables on the ID fields
+        (receiver, sender, group, type) and a sorted list of time windows,
+        then evaluated against the raw message map in one pass,
+        without parsing the message.
+
+        usage:
+
+            index = EnvelopeFilter()
+            index.add_rule('drop', sender=blocked_ids)
+            index.add_rule('queue:urgent', receiver=station, msg_type=[0x88, 0x89])
+            ...
+            targets = index.match(msg_info)
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.__rules: List[_Rule] = []
+        self.__compiled = True
+        # field => value => rules
+        self.__tables: Dict[str, Dict[str, List[_Rule]]] = {}
+        # rules without exact fields, sorted by 'since'
+        self.__starts: List[float] = []
+        self.__windows: List[_Rule] = []
+
+    def add_rule(self, target: Any,
+                 sender: Union[str, Iterable[str], None] = None,
+                 receiver: Union[str, Iterable[str], None] = None,
+                 group: Union[str, Iterable[str], None] = None,
+                 msg_type: Union[int, str, Iterable, None] = None,
+                 since: Optional[float] = None, until: Optional[float] = None):
+        """
+        Add rule, all the given conditions must match
+
+        :param target:   result for matched messages (action, queue, ...)
+        :param sender:   sender ID(s)
+        :param receiver: receiver ID(s)
+        :param group:    group ID(s)
+        :param msg_type: message type(s)
+        :param since:    message time >= since
+        :param until:    message time < until
+        """
+        rule = (len(self.__rules), target,
+                _values(sender), _values(receiver), _values(group), _values(msg_type, normalize=normalize_type),
+                since, until)
+        self.__rules.append(rule)
+        self.__compiled = False
+
+    def clear(self):
+        self.__rules = []
+        self.__compiled = False
+
+    def __len__(self) -> int:
+        return len(self.__rules)
+
+    def compile(self):
+        """ Build the index (called automatically before matching) """
+        tables = {'receiver': {}, 'sender': {}, 'group': {}, 'type': {}}
+        windows = []
+        for rule in self.__rules:
+            _, _, senders, receivers, groups, types, since, _ = rule
+            # index the rule with the first exact field
+            if receivers is not None:
+                field, values = 'receiver', receivers
+            elif senders is not None:
+                field, values = 'sender', senders
+            elif groups is not None:
+                field, values = 'group', groups
+            elif types is not None:
+                field, values = 'type', types
+            else:
+                windows.append(rule)
+                continue
+            table = tables[field]
+            for value in values:
+                table.setdefault(value, []).append(rule)
+        windows.sort(key=lambda item: _NEG_INF if item[6] is None else item[6])
+        self.__tables = tables
+        self.__windows = windows
+        self.__starts = [_NEG_INF if item[6] is None else item[6] for item in windows]
+        self.__compiled = True
+
+    def match(self, msg: Union[Mapper, StrMap]) -> List[Any]:
+        """ Get targets of all matched rules (in the order they were added) """
+        return [rule[1] for rule in self.__match(msg)]
+
+    def first(self, msg: Union[Mapper, StrMap]) -> Optional[Any]:
+        """ Get target of the first matched rule """
+        rules = self.__match(msg)
+        if len(rules) > 0:
+            return rules[0][1]
+
+    def __match(self, msg: Union[Mapper, StrMap]) -> List[_Rule]:
+        if not self.__compiled:
+            self.compile()
+        if isinstance(msg, Mapper):
+            msg = msg.to_map()
+        # raw input may be malformed, the bad values just don't match
+        sender = _id_value(msg.get('sender'))
+        receiver = _id_value(msg.get('receiver'))
+        group = _id_value(msg.get('group'))
+        msg_type = msg.get('type')
+        if isinstance(msg_type, (str, int)) and not isinstance(msg_type, bool):
+            msg_type = normalize_type(msg_type)
+        else:
+            msg_type = None
+        msg_time = _time_value(msg.get('time'))
+        # collect candidates
+        tables = self.__tables
+        candidates = []
+        for field, value in (('receiver', receiver), ('sender', sender), ('group', group), ('type', msg_type)):
+            if value is not None:
+                rules = tables[field].get(value)
+                if rules is not None:
+                    candidates.extend(rules)
+        if msg_time is None:
+            candidates.extend(self.__windows[:bisect_right(self.__starts, _NEG_INF)])
+        else:
+            candidates.extend(self.__windows[:bisect_right(self.__starts, msg_time)])
+        # check all conditions
+        results = []
+        for rule in candidates:
+            _, _, senders, receivers, groups, types, since, until = rule
+            if senders is not None and sender not in senders:
+                continue
+            elif receivers is not None and receiver not in receivers:
+                continue
+            elif groups is not None and group not in groups:
+                continue
+            elif types is not None and msg_type not in types:
+                continue
+            elif since is not None and (msg_time is None or msg_time < since):
+                continue
+            elif until is not None and (msg_time is None or msg_time >= until):
+                continue
+            results.append(rule)
+        if len(results) > 1:
+            results.sort(key=lambda item: item[0])
+        return results
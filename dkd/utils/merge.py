@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+import heapq
+import math
+from collections import deque
+from typing import Optional, Any, Callable, Iterable, Iterator, List, Tuple
+
+from mkm.types import Converter
+
+from ..protocol import Message
+
+from .dedup import message_key
+
+
+def message_time(msg: Message) -> float:
+    """ Get message time (seconds) without parsing the fields """
+    value = Converter.get_float(msg.get('time'))
+    if value is None:
+        when = msg.time
+        value = 0.0 if when is None else when.timestamp
+    return value
+
+
+def merge_messages(*streams: Iterable[Message],
+                   key: Callable[[Message], float] = message_time,
+                   dedup: bool = False, dedup_window: float = 300,
+                   dedup_key: Callable[[Any], Optional[bytes]] = message_key) -> Iterator[Message]:
+    """
+    Merge message streams (each one sorted by time) lazily
+
+    :param streams:      message streams
+    :param key:          function to get message time
+    :param dedup:        True to skip duplicated messages
+    :param dedup_window: seconds to remember the merged messages for dedup
+    :param dedup_key:    function to get identity from message
+    :return: messages sorted by time
+    """
+    merged = heapq.merge(*streams, key=key)
+    if not dedup:
+        yield from merged
+        return
+    seen = set()
+    recent: deque = deque()  # (time, identity)
+    for msg in merged:
+        msg_time = key(msg)
+        # forget the old ones
+        while recent and recent[0][0] < msg_time - dedup_window:
+            seen.discard(recent.popleft()[1])
+        identity = dedup_key(msg)
+        if identity is not None:
+            if identity in seen:
+                continue
+            seen.add(identity)
+            recent.append((msg_time, identity))
+        yield msg
+
+
+def time_windows(messages: Iterable[Message], size: float, step: Optional[float] = None,
+                 key: Callable[[Message], float] = message_time) -> Iterator[Tuple[float, float, List[Message]]]:
+    """
+    Group messages (sorted by time) into sliding time windows lazily
+
+        windows: [k * step, k * step + size), empty ones are skipped
+
+    :param messages: messages sorted by time
+    :param size:     window length (seconds)
+    :param step:     distance between windows, default is size (tumbling)
+    :param key:      function to get message time
+    :return: (start, end, messages in window)
+    """
+    if step is None:
+        step = size
+    assert 0 < step <= size, f'window error: size={size}, step={step}'
+    buffer: deque = deque()  # (time, msg)
+    start = None
+    for msg in messages:
+        msg_time = key(msg)
+        if start is None:
+            start = _first_start(msg_time, size, step)
+        # emit the windows ended before this message
+        while start + size <= msg_time:
+            if buffer:
+                yield start, start + size, [item[1] for item in buffer]
+            start += step
+            while buffer and buffer[0][0] < start:
+                buffer.popleft()
+            if not buffer:
+                # skip empty windows
+                start = max(start, _first_start(msg_time, size, step))
+        buffer.append((msg_time, msg))
+    # emit the rest
+    while buffer:
+        yield start, start + size, [item[1] for item in buffer]
+        start += step
+        while buffer and buffer[0][0] < start:
+            buffer.popleft()
+
+
+def _first_start(msg_time: float, size: float, step: float) -> float:
+    """ start of the first window containing the time """
+    return (math.floor((msg_time - size) / step) + 1) * step
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+import asyncio
+from collections import OrderedDict, deque
+from typing import Optional, Union, Any, List, Dict
+
+from mkm.types import Mapper
+
+from ..protocol import ReliableMessage
+from ..ext.content import normalize_type
+
+
+class MessageScheduler:
+    """ Priority scheduler for outgoing messages
+
+        Messages are classified by the 'type' in envelope (without
+        decrypting), the smaller priority value goes first; in the same
+        priority, receivers are served in turn (round-robin), so one busy
+        receiver won't block the others.
+
+        Each receiver can hold 'max_per_receiver' messages at most, when
+        full, the oldest message with lower priority will be dropped for
+        the new one, or the new one will be rejected.
+
+        The async 'get()' must be called in the same event loop as 'put()'.
+    """
+
+    def __init__(self, priorities: Optional[Dict[Union[int, str], int]] = None,
+                 default_priority: int = 0, max_per_receiver: int = 1024):
+        """
+        Create scheduler
+
+        :param priorities:       message type => priority (smaller is higher)
+        :param default_priority: priority for other types
+        :param max_per_receiver: max messages waiting for one receiver
+        """
+        super().__init__()
+        table = {}
+        if priorities is not None:
+            for msg_type, priority in priorities.items():
+                table[normalize_type(msg_type)] = priority
+        self.__priorities = table
+        self.__default = default_priority
+        self.__max_per_receiver = max_per_receiver
+        # priority => receiver => messages
+        self.__levels: Dict[int, OrderedDict] = {}
+        self.__order: List[int] = []
+        # receiver => count
+        self.__counts: Dict[str, int] = {}
+        self.__total = 0
+        self.__dropped = 0
+        self.__waiters: deque = deque()
+
+    def priority(self, msg: ReliableMessage) -> int:
+        """ Get priority by envelope type """
+        msg_type = msg.get('type') if isinstance(msg, Mapper) else None
+        if msg_type is None:
+            return self.__default
+        return self.__priorities.get(normalize_type(msg_type), self.__default)
+
+    def put(self, msg: ReliableMessage) -> bool:
+        """ Add message, return False if rejected """
+        receiver = str(msg.receiver)
+        priority = self.priority(msg)
+        if self.__counts.get(receiver, 0) >= self.__max_per_receiver:
+            if not self.__evict(receiver=receiver, priority=priority):
+                self.__dropped += 1
+                return False
+        level = self.__levels.get(priority)
+        if level is None:
+            level = OrderedDict()
+            self.__levels[priority] = level
+            self.__order = sorted(self.__levels.keys())
+        queue = level.get(receiver)
+        if queue is None:
+            queue = deque()
+            level[receiver] = queue
+        queue.append(msg)
+        self.__counts[receiver] = self.__counts.get(receiver, 0) + 1
+        self.__total += 1
+        self.__wakeup()
+        return True
+
+    def __evict(self, receiver: str, priority: int) -> bool:
+        """ drop the oldest message with lower priority for the receiver """
+        for level_priority in reversed(self.__order):
+            if level_priority <= priority:
+                break
+            level = self.__levels[level_priority]
+            queue = level.get(receiver)
+            if queue:
+                queue.popleft()
+                if len(queue) == 0:
+                    del level[receiver]
+                self.__counts[receiver] -= 1
+                self.__total -= 1
+                self.__dropped += 1
+                return True
+        return False
+
+    def get_nowait(self) -> Optional[ReliableMessage]:
+        """ Get next message, None if empty """
+        for priority in self.__order:
+            level = self.__levels[priority]
+            if len(level) == 0:
+                continue
+            receiver, queue = next(iter(level.items()))
+            msg = queue.popleft()
+            if len(queue) == 0:
+                del level[receiver]
+            else:
+                # next turn for other receivers
+                level.move_to_end(receiver)
+            count = self.__counts[receiver] - 1
+            if count == 0:
+                del self.__counts[receiver]
+            else:
+                self.__counts[receiver] = count
+            self.__total -= 1
+            return msg
+
+    async def get(self) -> ReliableMessage:
+        """ Wait for next message """
+        while True:
+            msg = self.get_nowait()
+            if msg is not None:
+                return msg
+            waiter = asyncio.get_running_loop().create_future()
+            self.__waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    self.__waiters.remove(waiter)
+                except ValueError:
+                    # already popped by wakeup
+                    pass
+                if self.__total > 0 and not waiter.cancelled():
+                    # woken but cancelled, pass the wakeup to the next waiter
+                    self.__wakeup()
+                raise
+
+    def __wakeup(self):
+        waiters = self.__waiters
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    #
+    #   Metrics
+    #
+
+    def __len__(self) -> int:
+        return self.__total
+
+    def depth(self, receiver: Any) -> int:
+        """ messages waiting for the receiver """
+        return self.__counts.get(str(receiver), 0)
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """ queue depths """
+        priorities = {}
+        for priority in self.__order:
+            priorities[priority] = sum(len(queue) for queue in self.__levels[priority].values())
+        return {
+            'total': self.__total,
+            'receivers': len(self.__counts),
+            'max_receiver_depth': max(self.__counts.values(), default=0),
+            'priorities': priorities,
+            'dropped': self.__dropped,
+        }
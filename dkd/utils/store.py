@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+#
+#   Dao-Ke-Dao: Universal Message Module
+#
+#                                Written in 2026 by Moky <albert.moky@gmail.com>
+#
+# ==============================================================================
+# MIT License
+#
+# Copyright (c) 2026 Albert Moky
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+"""
+    Message Log
+    ~~~~~~~~~~~
+
+        +------+-------+------+--------+----------+---------+
+        | size | flags | time | id_len | receiver | message |
+        +------+-------+------+--------+----------+---------+
+
+        size:     uint32, bytes after this field
+        flags:    uint8, 1 for deleted (delivered)
+        time:     float64, message time
+        id_len:   uint16, length of receiver
+        receiver: UTF-8 string
+        message:  binary form of the reliable message
+
+    All fields are big-endian; records are appended to the file only,
+    the deleted records will be removed by compaction.
+"""
+
+import mmap
+import os
+import struct
+import threading
+from bisect import bisect_left, insort
+from typing import Optional, Iterator, List, Dict, Tuple
+
+from mkm.types import Converter
+from mkm.protocol import ID
+
+from ..protocol import ReliableMessage
+from ..format import ReliableMessageCoder
+
+
+_HEAD = struct.Struct('>IBdH')
+
+FLAG_DELETED = 0x01
+
+# (time, offset)
+_Entry = Tuple[float, int]
+
+
+class MessageLog:
+    """ Append-only file of reliable messages
+
+        The index (receiver => entries sorted by time) is built from the
+        record heads when opening, and messages are read through mmap,
+        decoded only when they're fetched.
+    """
+
+    def __init__(self, path: str, coder: Optional[ReliableMessageCoder] = None):
+        super().__init__()
+        if coder is None:
+            coder = ReliableMessageCoder()
+        self.__path = path
+        self.__coder = coder
+        self.__lock = threading.RLock()
+        self.__index: Dict[str, List[_Entry]] = {}
+        self.__file = None
+        self.__map: Optional[mmap.mmap] = None
+        self.__size = 0
+        self.__open()
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        with self.__lock:
+            self.__unmap()
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = None
+
+    def flush(self):
+        with self.__lock:
+            self.__file.flush()
+            os.fsync(self.__file.fileno())
+
+    def __open(self):
+        if not os.path.exists(self.__path):
+            open(self.__path, 'wb').close()
+        # not in append mode, so the flags can be written in place
+        file = open(self.__path, 'r+b')
+        file.seek(0, os.SEEK_END)
+        self.__file = file
+        self.__size = file.tell()
+        self.__index = {}
+        self.__load()
+
+    def __unmap(self):
+        if self.__map is not None:
+            self.__map.close()
+            self.__map = None
+
+    def __view(self) -> Optional[mmap.mmap]:
+        """ get mmap of the whole file """
+        mapped = self.__map
+        if mapped is not None and len(mapped) == self.__size:
+            return mapped
+        self.__unmap()
+        if self.__size == 0:
+            return None
+        self.__file.flush()
+        mapped = mmap.mmap(self.__file.fileno(), self.__size, access=mmap.ACCESS_READ)
+        self.__map = mapped
+        return mapped
+
+    def __load(self):
+        """ build index from the record heads """
+        view = self.__view()
+        offset = 0
+        size = self.__size
+        index = self.__index
+        while offset + _HEAD.size <= size:
+            length, flags, msg_time, id_len = _HEAD.unpack_from(view, offset)
+            end = offset + 4 + length
+            if end > size or 4 + length < _HEAD.size + id_len:
+                break
+            if flags & FLAG_DELETED == 0:
+                start = offset + _HEAD.size
+                receiver = str(view[start:start + id_len], 'utf-8')
+                insort(index.setdefault(receiver, []), (msg_time, offset))
+            offset = end
+        if offset < size:
+            # broken tail (not finished writing), drop it
+            self.__unmap()
+            self.__file.truncate(offset)
+            self.__file.seek(offset)
+            self.__size = offset
+
+    #
+    #   Write
+    #
+
+    def append(self, msg: ReliableMessage) -> int:
+        """ Append message, return the offset of the record """
+        receiver = str(msg.receiver).encode('utf-8')
+        msg_time = Converter.get_float(msg.get('time'), 0.0)
+        body = self.__coder.encode(msg)
+        length = _HEAD.size - 4 + len(receiver) + len(body)
+        head = _HEAD.pack(length, 0, msg_time, len(receiver))
+        with self.__lock:
+            offset = self.__size
+            self.__file.write(head)
+            self.__file.write(receiver)
+            self.__file.write(body)
+            self.__size = offset + 4 + length
+            insort(self.__index.setdefault(str(msg.receiver), []), (msg_time, offset))
+        return offset
+
+    def remove(self, receiver: ID, until: Optional[float] = None) -> int:
+        """ Mark the messages for receiver (before 'until') as delivered """
+        with self.__lock:
+            entries = self.__index.get(str(receiver))
+            if entries is None:
+                return 0
+            if until is None:
+                end = len(entries)
+            else:
+                end = bisect_left(entries, (until, -1))
+            if end == 0:
+                return 0
+            file = self.__file
+            flag = bytes([FLAG_DELETED])
+            for _, offset in entries[:end]:
+                file.seek(offset + 4)
+                file.write(flag)
+            file.seek(self.__size)
+            del entries[:end]
+            if len(entries) == 0:
+                self.__index.pop(str(receiver), None)
+            return end
+
+    #
+    #   Read
+    #
+
+    @property
+    def receivers(self) -> List[str]:
+        with self.__lock:
+            return list(self.__index.keys())
+
+    def count(self, receiver: ID) -> int:
+        with self.__lock:
+            entries = self.__index.get(str(receiver))
+            return 0 if entries is None else len(entries)
+
+    def scan(self, receiver: ID, since: Optional[float] = None,
+             until: Optional[float] = None) -> Iterator[ReliableMessage]:
+        """ Get messages for receiver in time range [since, until) lazily """
+        with self.__lock:
+            entries = self.__index.get(str(receiver))
+            if entries is None:
+                return
+            start = 0 if since is None else bisect_left(entries, (since, -1))
+            end = len(entries) if until is None else bisect_left(entries, (until, -1))
+            selected = entries[start:end]
+        for _, offset in selected:
+            msg = self.__read(offset)
+            if msg is not None:
+                yield msg
+
+    def __read(self, offset: int) -> Optional[ReliableMessage]:
+        with self.__lock:
+            view = self.__view()
+            length, flags, _, id_len = _HEAD.unpack_from(view, offset)
+            if flags & FLAG_DELETED:
+                return None
+            # copy the record out of mmap, so the file can be remapped
+            body = view[offset + _HEAD.size + id_len:offset + 4 + length]
+        # decode to a JSON-clean map, so the message can be forwarded as is
+        info = self.__coder.decode_map(body)
+        if info is not None:
+            return ReliableMessage.parse(msg=info)
+
+    #
+    #   Compaction
+    #
+
+    def compact(self) -> int:
+        """ Rewrite the file without the deleted records, return bytes saved """
+        with self.__lock:
+            view = self.__view()
+            old_size = self.__size
+            temp = self.__path + '.tmp'
+            with open(temp, 'wb') as file:
+                offset = 0
+                while offset < old_size:
+                    length, flags, _, _ = _HEAD.unpack_from(view, offset)
+                    end = offset + 4 + length
+                    if flags & FLAG_DELETED == 0:
+                        file.write(view[offset:end])
+                    offset = end
+                file.flush()
+                os.fsync(file.fileno())
+            self.close()
+            os.replace(temp, self.__path)
+            self.__open()
+            return old_size - self.__size
@@ -29,7 +29,7 @@ setup(
     description='A common message module',
     long_description=readme,
     long_description_content_type='text/markdown',
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
     classifiers=[
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',